@@ -1,16 +1,85 @@
 from streamcontroller_plugin_tools.installation_helpers import create_venv
 from os.path import join, abspath, dirname
 import json
+import hashlib
+import io
 import urllib.request
 import zipfile
+import tempfile
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import requests
+except ImportError:
+    requests = None
 
 toplevel = dirname(abspath(__file__))
 
+# Copy buffer size for streaming the release download (1 MiB)
+COPY_BUFFER_SIZE = 1024 * 1024
+
 # Create virtual environment for backend
 create_venv(join(toplevel, "backend", ".venv"), join(toplevel, "backend", "requirements.txt"))
 
+def copy_chunks(chunks, fileobj, hasher=None):
+    """Write an iterable of byte chunks to fileobj, feeding hasher if given."""
+    for chunk in chunks:
+        fileobj.write(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+
+def download_to(fileobj, url, session=None, hasher=None):
+    """
+    Stream url into fileobj using a COPY_BUFFER_SIZE buffer.
+
+    With a requests session the connection is kept alive across the GitHub
+    release redirect; without one, urllib is used. If hasher is given, it
+    is updated with every chunk as it is written.
+    """
+    if session is not None:
+        with session.get(url, stream=True, allow_redirects=True, timeout=30) as response:
+            response.raise_for_status()
+            copy_chunks(response.iter_content(COPY_BUFFER_SIZE), fileobj, hasher)
+    else:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            copy_chunks(iter(lambda: response.read(COPY_BUFFER_SIZE), b""), fileobj, hasher)
+
+def fetch_expected_sha256(url, session=None):
+    """Return the digest from the release's .sha256 sidecar, or None if unavailable."""
+    sidecar = io.BytesIO()
+    try:
+        download_to(sidecar, f"{url}.sha256", session)
+    except Exception as e:
+        print(f"Warning: No checksum available for the extension ({e}), skipping verification")
+        return None
+
+    fields = sidecar.getvalue().decode("ascii", errors="replace").split()
+    return fields[0].lower() if fields else None
+
+def extract_member(zip_ref, info, extract_dir):
+    """Extract a single zip entry into extract_dir using a large copy buffer."""
+    extract_root = os.path.realpath(extract_dir)
+    target = os.path.realpath(join(extract_root, info.filename))
+
+    # Refuse entries that would escape the extraction directory
+    if os.path.commonpath([extract_root, target]) != extract_root:
+        raise ValueError(f"Unsafe path in extension archive: {info.filename}")
+
+    if info.is_dir():
+        os.makedirs(target, exist_ok=True)
+        return
+
+    os.makedirs(dirname(target), exist_ok=True)
+    with zip_ref.open(info) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, length=COPY_BUFFER_SIZE)
+
+    # Preserve permissions stored in the archive, if any
+    mode = (info.external_attr >> 16) & 0o777
+    if mode:
+        os.chmod(target, mode)
+
 # Download and extract Chrome extension
 def download_and_extract_extension():
     """Download the Chrome extension from GitHub releases and extract it."""
@@ -29,32 +98,54 @@ def download_and_extract_extension():
         dist_dir = join(toplevel, "dist")
         os.makedirs(dist_dir, exist_ok=True)
 
-        # Download path
-        download_path = join(dist_dir, extension_filename)
-
         print(f"Downloading Chrome extension v{version}...")
         print(f"URL: {download_url}")
 
-        # Download the zip file
-        urllib.request.urlretrieve(download_url, download_path)
-
         # Extract to dist/chrome_extension
         extract_dir = join(dist_dir, "chrome_extension")
 
-        # Remove existing directory if it exists
-        if os.path.exists(extract_dir):
-            shutil.rmtree(extract_dir)
-
-        os.makedirs(extract_dir, exist_ok=True)
-
-        print(f"Extracting to {extract_dir}...")
-
-        # Extract the zip file
-        with zipfile.ZipFile(download_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-
-        # Clean up the zip file
-        os.remove(download_path)
+        # Stream the zip into a spooled buffer (only spills to disk for
+        # unexpectedly large payloads) and extract straight from it
+        session = requests.Session() if requests is not None else None
+        try:
+            expected_sha256 = fetch_expected_sha256(download_url, session)
+
+            with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buffer:
+                # Hash while downloading; retry once on a checksum mismatch
+                for attempt in range(2):
+                    buffer.seek(0)
+                    buffer.truncate()
+                    hasher = hashlib.sha256()
+                    download_to(buffer, download_url, session, hasher)
+
+                    if expected_sha256 is None or hasher.hexdigest() == expected_sha256:
+                        break
+                    print("Warning: Extension checksum mismatch, retrying download...")
+                else:
+                    raise ValueError("Downloaded extension failed checksum verification")
+
+                buffer.seek(0)
+
+                # Remove existing directory if it exists
+                if os.path.exists(extract_dir):
+                    shutil.rmtree(extract_dir)
+
+                os.makedirs(extract_dir, exist_ok=True)
+
+                print(f"Extracting to {extract_dir}...")
+
+                # Extract the zip file. ZipFile serialises reads of the shared
+                # archive internally, so entries can be inflated and written
+                # from several threads
+                with zipfile.ZipFile(buffer, 'r') as zip_ref, \
+                        ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                    list(executor.map(
+                        lambda info: extract_member(zip_ref, info, extract_dir),
+                        zip_ref.infolist()
+                    ))
+        finally:
+            if session is not None:
+                session.close()
 
         print(f"Chrome extension v{version} installed successfully!")
         print(f"Location: {extract_dir}")
@@ -8,53 +8,119 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw
+from gi.repository import Gtk, Adw, GLib
 
-import threading
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger as log
 from .ImageManager import ImageManager, ImageMode
 
+# Image mode for connection states that render grayed out (default: REGULAR)
+_CONNECTION_STATE_TO_MODE = {
+    "disconnected": ImageMode.DISABLED,
+    "not_in_meeting": ImageMode.DISABLED,
+}
+
+# Approval UI sections: header title and (label, css class, handler) buttons
+_APPROVAL_SECTIONS = {
+    "pending": {
+        "title": "Pending Pairing Requests",
+        "buttons": [
+            ("Approve", "suggested-action", "on_approve_instance"),
+            ("Deny", "destructive-action", "on_deny_instance"),
+        ],
+    },
+    "approved": {
+        "title": "Authorized Instances",
+        "buttons": [
+            ("Revoke", "destructive-action", "on_revoke_instance"),
+        ],
+    },
+}
+
 
 class GoogleMeetActionBase(ActionBase):
     """Base class for all Google Meet actions"""
 
+    # Actions whose state comes from the backend snapshot are updated by
+    # backend pushes; on_tick then only polls every N ticks as a watchdog.
+    # Subclasses depending on anything else set this to False
+    PUSH_DRIVEN = True
+    WATCHDOG_POLL_INTERVAL = 10
+
+    # Ticks closer together than this (seconds) are ignored, capping on_tick
+    # work at 10 Hz whatever rate the host ticks at
+    MIN_TICK_INTERVAL = 0.1
+
+    # Delay (ms) before a port change is applied, so holding the spinner
+    # arrows does not restart the server on every increment
+    PORT_CHANGE_DEBOUNCE_MS = 300
+
+    # Shared worker pool for blocking backend calls triggered from the UI
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gmeet-bg")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.has_configuration = True
 
-        # Connection status label
+        # Connection status label and the connection state it currently shows
         self.status_label = Gtk.Label(
             label="No Connection",
             css_classes=["bold", "red"]
         )
+        self._status_connected = False
+
+        # Pending GLib source for a debounced port change
+        self._port_change_source = None
+
+        # Approval expander (created with the config rows)
+        self.approval_expander = None
 
-        # Track approval UI rows
-        self.approval_rows = []
+        # Track approval UI rows by key, plus the (title, subtitle) they show
+        self._row_cache = {}
+        self._row_text = {}
+
+        # Rows last rendered into the expander, to skip no-op refreshes
+        self._approval_fingerprint = None
 
         # State caching for preventing unnecessary re-renders
         self._cached_state = None
+        self._cached_state_token = None
+
+        # Key describing what the last render put on the key (see is_render_needed)
+        self._last_render_key = None
+
+        # Connection state seen by the last update and ticks since the last poll
+        self._last_connection_state = None
+        self._idle_ticks = 0
+
+        # When on_tick last did any work (time.monotonic())
+        self._last_tick = 0.0
+
+        # Whether the action was on the deck's active page at the last tick
+        self._visible = True
+
+    def _refresh_backend_status(self) -> tuple[bool, bool]:
+        """
+        Query connection and meeting status from the backend.
+
+        The plugin caches the result for a short TTL and shares it between
+        all actions, so one tick only crosses the backend boundary once.
+
+        Returns:
+            Tuple of (connected, in_meeting)
+        """
+        return self.plugin_base.get_backend_status()
 
     def get_connected(self) -> bool:
         """Check if extension is connected"""
-        try:
-            if self.plugin_base.backend is None:
-                return False
-            return self.plugin_base.backend.get_connected()
-        except Exception as e:
-            log.error(f"Error checking connection: {e}")
-            return False
+        return self._refresh_backend_status()[0]
 
     def get_in_meeting(self) -> bool:
         """Check if currently in a meeting"""
-        try:
-            if self.plugin_base.backend is None:
-                return False
-            return self.plugin_base.backend.get_in_meeting() or False
-        except Exception as e:
-            log.error(f"Error checking meeting status: {e}")
-            return False
+        return self._refresh_backend_status()[1]
 
     def get_config_rows(self) -> list:
         """Get configuration rows for this action"""
@@ -67,6 +133,9 @@ class GoogleMeetActionBase(ActionBase):
 
         # Extension approval section
         self.approval_expander = Adw.ExpanderRow()
+        self._row_cache.clear()
+        self._row_text.clear()
+        self._approval_fingerprint = None
         self.approval_expander.set_title("Extension Approvals")
         self.approval_expander.set_subtitle("Manage browser extension connections")
 
@@ -98,26 +167,32 @@ class GoogleMeetActionBase(ActionBase):
         self.update_status_label()
 
     def on_change_port(self, spinner, *args):
-        """Handle port change"""
+        """Handle port change (debounced while the spinner is still moving)"""
+        if self._port_change_source is not None:
+            GLib.source_remove(self._port_change_source)
+
+        self._port_change_source = GLib.timeout_add(
+            self.PORT_CHANGE_DEBOUNCE_MS, self._apply_port_change, spinner
+        )
+
+    def _apply_port_change(self, spinner) -> bool:
+        """Save the new port and restart the backend server with it"""
+        self._port_change_source = None
+
         settings = self.plugin_base.get_settings()
         new_port = int(spinner.get_value())
         settings["websocket_port"] = new_port
         self.plugin_base.set_settings(settings)
 
         # Update backend
-        threading.Thread(
-            target=self._update_websocket_settings,
-            daemon=True,
-            name="update_websocket_settings"
-        ).start()
+        host = settings.get("websocket_host", "127.0.0.1")
+        self._executor.submit(self._update_websocket_settings, host, new_port)
 
-    def _update_websocket_settings(self):
+        return False
+
+    def _update_websocket_settings(self, host: str, port: int):
         """Update WebSocket settings in backend"""
         try:
-            settings = self.plugin_base.get_settings()
-            host = settings.get("websocket_host", "127.0.0.1")
-            port = settings.get("websocket_port", 8765)
-
             self.plugin_base.backend.update_websocket_settings(host, port)
             self.update_status_label()
         except Exception as e:
@@ -125,26 +200,36 @@ class GoogleMeetActionBase(ActionBase):
 
     def update_status_label(self) -> None:
         """Update connection status label"""
-        threading.Thread(
-            target=self._update_status_label,
-            daemon=True,
-            name="update_status_label"
-        ).start()
+        self._executor.submit(self._update_status_label)
 
     def _update_status_label(self):
-        """Update status label (thread-safe)"""
+        """Query connection status on the worker and hand changes to the GTK thread"""
         try:
-            if self.get_connected():
-                self.status_label.set_label("Connected")
-                self.status_label.remove_css_class("red")
-                self.status_label.add_css_class("green")
-            else:
-                self.status_label.set_label("No Connection")
-                self.status_label.remove_css_class("green")
-                self.status_label.add_css_class("red")
+            connected = self.get_connected()
+            if connected != self._status_connected:
+                GLib.idle_add(self._apply_status_label, connected)
         except Exception as e:
             log.error(f"Error updating status label: {e}")
 
+    def _apply_status_label(self, connected: bool) -> bool:
+        """
+        Apply connection status to the label (runs on the GTK main thread).
+
+        Returns:
+            False so GLib.idle_add does not reschedule it
+        """
+        if connected == self._status_connected:
+            return False
+
+        if connected:
+            self.status_label.set_label("Connected")
+            self.status_label.set_css_classes(["bold", "green"])
+        else:
+            self.status_label.set_label("No Connection")
+            self.status_label.set_css_classes(["bold", "red"])
+        self._status_connected = connected
+        return False
+
     def get_custom_config_area(self):
         """Get custom configuration area widget"""
         self.update_status_label()
@@ -155,182 +240,203 @@ class GoogleMeetActionBase(ActionBase):
         self.refresh_approval_ui()
 
     def refresh_approval_ui(self):
-        """Refresh the approval management UI"""
-        if not hasattr(self, 'approval_expander'):
+        """
+        Refresh the approval management UI.
+
+        The backend is queried on the worker pool; rows are rendered on the
+        GTK main loop once the data is available.
+        """
+        if self.approval_expander is None:
             return
 
-        try:
-            # Clear existing rows
-            for row in self.approval_rows:
-                self.approval_expander.remove(row)
-            self.approval_rows.clear()
+        self._executor.submit(self._fetch_pairing_state)
 
-            # Get pending and approved pairing requests
-            pending = []
-            approved = []
+    def _fetch_pairing_state(self):
+        """
+        Fetch pairing requests from the backend and schedule a render.
 
-            if self.plugin_base.backend is not None:
-                try:
-                    pending = self.plugin_base.backend.get_pending_pairing_requests()
-                    approved = self.plugin_base.backend.get_authorized_instances()
-                except Exception as e:
-                    log.error(f"Error getting pairing requests: {e}")
-
-            # Add pending approvals
-            if pending:
-                pending_label = Adw.ActionRow()
-                pending_label.set_title("Pending Pairing Requests")
-                pending_label.set_title_lines(1)
-                self.approval_expander.add_row(pending_label)
-                self.approval_rows.append(pending_label)
-
-                for request in pending:
-                    metadata = request.metadata
-
-                    # Build title from metadata
-                    extension_name = metadata.get('extension_name', 'Unknown Extension')
-                    browser_name = metadata.get('browser_name', 'Unknown Browser')
-                    browser_version = metadata.get('browser_version', '')
-
-                    title = f"{extension_name} ({browser_name}"
-                    if browser_version:
-                        title += f" {browser_version}"
-                    title += ")"
-
-                    # Build subtitle with OS and instance info
-                    os_name = metadata.get('os', 'Unknown OS')
-                    instance_short = request.instance_id[:8] if request.instance_id else 'Unknown'
-                    subtitle = f"{os_name} • Instance: {instance_short}"
-
-                    row = Adw.ActionRow()
-                    row.set_title(title)
-                    row.set_subtitle(subtitle)
-                    row.set_title_lines(2)
-
-                    # Approve button
-                    approve_btn = Gtk.Button(label="Approve")
-                    approve_btn.add_css_class("suggested-action")
-                    approve_btn.set_valign(Gtk.Align.CENTER)
-                    approve_btn.connect("clicked", self.on_approve_instance,
-                                      request.extension_id, request.instance_id)
-                    row.add_suffix(approve_btn)
-
-                    # Deny button
-                    deny_btn = Gtk.Button(label="Deny")
-                    deny_btn.add_css_class("destructive-action")
-                    deny_btn.set_valign(Gtk.Align.CENTER)
-                    deny_btn.connect("clicked", self.on_deny_instance,
-                                    request.extension_id, request.instance_id)
-                    row.add_suffix(deny_btn)
-
-                    self.approval_expander.add_row(row)
-                    self.approval_rows.append(row)
-
-            # Add approved instances
-            if approved:
-                approved_label = Adw.ActionRow()
-                approved_label.set_title("Authorized Instances")
-                approved_label.set_title_lines(1)
-                self.approval_expander.add_row(approved_label)
-                self.approval_rows.append(approved_label)
-
-                for request in approved:
-                    metadata = request.metadata
-
-                    # Build title from metadata
-                    extension_name = metadata.get('extension_name', 'Unknown Extension')
-                    browser_name = metadata.get('browser_name', 'Unknown Browser')
-                    browser_version = metadata.get('browser_version', '')
-
-                    title = f"{extension_name} ({browser_name}"
-                    if browser_version:
-                        title += f" {browser_version}"
-                    title += ")"
-
-                    # Build subtitle with OS and instance info
-                    os_name = metadata.get('os', 'Unknown OS')
-                    instance_short = request.instance_id[:8] if request.instance_id else 'Unknown'
-                    subtitle = f"{os_name} • Instance: {instance_short}"
-
-                    row = Adw.ActionRow()
-                    row.set_title(title)
-                    row.set_subtitle(subtitle)
-                    row.set_title_lines(2)
-
-                    # Revoke button
-                    revoke_btn = Gtk.Button(label="Revoke")
-                    revoke_btn.add_css_class("destructive-action")
-                    revoke_btn.set_valign(Gtk.Align.CENTER)
-                    revoke_btn.connect("clicked", self.on_revoke_instance,
-                                      request.extension_id, request.instance_id)
-                    row.add_suffix(revoke_btn)
-
-                    self.approval_expander.add_row(row)
-                    self.approval_rows.append(row)
+        The backend returns plain tuples in one round-trip; they are turned
+        into (key, (title, subtitle)) rows here, on the worker. If the rows
+        match what is already displayed, the GTK main loop is not touched
+        at all.
+        """
+        # Get pending and approved pairing requests
+        pending = []
+        approved = []
+
+        if self.plugin_base.backend is not None:
+            try:
+                pending, approved = self.plugin_base.backend.get_pairing_state()
+            except Exception as e:
+                log.error(f"Error getting pairing requests: {e}")
+
+        try:
+            # Desired rows in display order, keyed by (kind, extension_id, instance_id)
+            desired = []
+
+            for section, requests in (("pending", pending), ("approved", approved)):
+                if not requests:
+                    continue
+                desired.append(((f"{section}_header", None, None), None))
+                desired.extend(
+                    ((section, request[0], request[1]), self._format_request(request))
+                    for request in requests
+                )
 
             # If nothing to show
             if not pending and not approved:
-                empty_row = Adw.ActionRow()
-                empty_row.set_title("No extensions")
-                empty_row.set_subtitle("Extensions will appear here when they connect")
-                empty_row.set_title_lines(1)
-                self.approval_expander.add_row(empty_row)
-                self.approval_rows.append(empty_row)
+                desired.append((("empty", None, None), None))
+        except Exception as e:
+            log.error(f"Error reading pairing requests: {e}")
+            return
+
+        # Nothing changed since the last render
+        fingerprint = tuple(desired)
+        if fingerprint == self._approval_fingerprint:
+            return
+
+        GLib.idle_add(self._render_approval_ui, fingerprint)
+
+    def _render_approval_ui(self, desired: tuple) -> bool:
+        """
+        Render approval rows from already-formatted pairing rows.
+        Must run on the GTK main loop.
 
+        Returns:
+            False so GLib.idle_add does not reschedule it
+        """
+        try:
+            self._sync_approval_rows(desired)
+            self._approval_fingerprint = desired
         except Exception as e:
             log.error(f"Error refreshing approval UI: {e}")
 
+        return False
+
+    def _sync_approval_rows(self, desired: list) -> None:
+        """
+        Bring the displayed approval rows in line with the desired rows.
+
+        Rows are diffed by key: widgets for keys that are still present are
+        reused (only their labels are updated when the metadata changed) and
+        new widgets are only built for keys that were not displayed before.
+
+        Args:
+            desired: Sequence of (key, (title, subtitle) or None) in display order
+        """
+        desired_keys = [key for key, _ in desired]
+        desired_set = set(desired_keys)
+        current_keys = list(self._row_cache)
+
+        # Rows up to the first difference stay where they are
+        keep = 0
+        for current_key, desired_key in zip(current_keys, desired_keys):
+            if current_key != desired_key:
+                break
+            keep += 1
+
+        # Detach everything after the common prefix; drop rows that went away
+        for key in current_keys[keep:]:
+            self.approval_expander.remove(self._row_cache[key])
+            if key not in desired_set:
+                del self._row_cache[key]
+                self._row_text.pop(key, None)
+
+        row_cache = {}
+        for index, (key, text) in enumerate(desired):
+            row = self._row_cache.get(key)
+            if row is None:
+                row = self._create_approval_row(key)
+
+            if text is not None:
+                if self._row_text.get(key) != text:
+                    row.set_title(text[0])
+                    row.set_subtitle(text[1])
+                    self._row_text[key] = text
+
+            if index >= keep:
+                self.approval_expander.add_row(row)
+            row_cache[key] = row
+
+        self._row_cache = row_cache
+
+    def _create_approval_row(self, key: tuple) -> Adw.ActionRow:
+        """Build the widget for an approval row key"""
+        kind, extension_id, instance_id = key
+        row = Adw.ActionRow()
+
+        if kind in _APPROVAL_SECTIONS:
+            # Request row: title/subtitle are filled in by _sync_approval_rows
+            row.set_title_lines(2)
+
+            for label, css_class, handler_name in _APPROVAL_SECTIONS[kind]["buttons"]:
+                button = Gtk.Button(label=label)
+                button.add_css_class(css_class)
+                button.set_valign(Gtk.Align.CENTER)
+                button.connect("clicked", getattr(self, handler_name),
+                               extension_id, instance_id)
+                row.add_suffix(button)
+        elif kind == "empty":
+            row.set_title("No extensions")
+            row.set_subtitle("Extensions will appear here when they connect")
+            row.set_title_lines(1)
+        else:
+            # Section header ("<section>_header")
+            row.set_title(_APPROVAL_SECTIONS[kind[:-len("_header")]]["title"])
+            row.set_title_lines(1)
+
+        return row
+
+    @staticmethod
+    def _format_request(request: tuple) -> tuple[str, str]:
+        """
+        Build (title, subtitle) for a pairing request row from its metadata.
+
+        Takes a row from Backend.get_pairing_state(). Called once per request
+        per refresh on the worker; _sync_approval_rows only pushes the result
+        to GTK when it differs from what the row shows.
+        """
+        _, instance_id, extension_name, browser_name, browser_version, os_name = request
+
+        # Build title from metadata
+        extension_name = extension_name or 'Unknown Extension'
+        browser_name = browser_name or 'Unknown Browser'
+
+        browser = f"{browser_name} {browser_version}" if browser_version else browser_name
+        title = f"{extension_name} ({browser})"
+
+        # Build subtitle with OS and instance info
+        os_name = os_name or 'Unknown OS'
+        instance_short = instance_id[:8] if instance_id else 'Unknown'
+        subtitle = f"{os_name} • Instance: {instance_short}"
+
+        return title, subtitle
+
     def on_approve_instance(self, button, extension_id, instance_id):
         """Approve an instance"""
-        try:
-            if self.plugin_base.backend is not None:
-                self.plugin_base.backend.approve_instance(extension_id, instance_id)
-                log.info(f"Approved instance: {extension_id}/{instance_id}")
-                # Refresh UI after short delay
-                threading.Thread(
-                    target=self._delayed_refresh_approval_ui,
-                    daemon=True,
-                    name="refresh_approval_ui"
-                ).start()
-        except Exception as e:
-            log.error(f"Error approving instance: {e}")
+        self._executor.submit(self._run_pairing_action, "approve_instance", "Approved",
+                              extension_id, instance_id)
 
     def on_deny_instance(self, button, extension_id, instance_id):
         """Deny an instance"""
-        try:
-            if self.plugin_base.backend is not None:
-                self.plugin_base.backend.deny_instance(extension_id, instance_id)
-                log.info(f"Denied instance: {extension_id}/{instance_id}")
-                # Refresh UI after short delay
-                threading.Thread(
-                    target=self._delayed_refresh_approval_ui,
-                    daemon=True,
-                    name="refresh_approval_ui"
-                ).start()
-        except Exception as e:
-            log.error(f"Error denying instance: {e}")
+        self._executor.submit(self._run_pairing_action, "deny_instance", "Denied",
+                              extension_id, instance_id)
 
     def on_revoke_instance(self, button, extension_id, instance_id):
         """Revoke an approved instance"""
+        self._executor.submit(self._run_pairing_action, "revoke_instance", "Revoked",
+                              extension_id, instance_id)
+
+    def _run_pairing_action(self, method_name: str, verb: str, extension_id: str, instance_id: str):
+        """Call a backend pairing method off the GTK thread, then refresh the approval UI"""
         try:
             if self.plugin_base.backend is not None:
-                self.plugin_base.backend.revoke_instance(extension_id, instance_id)
-                log.info(f"Revoked instance: {extension_id}/{instance_id}")
-                # Refresh UI after short delay
-                threading.Thread(
-                    target=self._delayed_refresh_approval_ui,
-                    daemon=True,
-                    name="refresh_approval_ui"
-                ).start()
+                getattr(self.plugin_base.backend, method_name)(extension_id, instance_id)
+                log.info(f"{verb} instance: {extension_id}/{instance_id}")
+                # The backend updates pairing state before the call returns
+                self.refresh_approval_ui()
         except Exception as e:
-            log.error(f"Error revoking instance: {e}")
-
-    def _delayed_refresh_approval_ui(self):
-        """Refresh approval UI after short delay"""
-        import time
-        time.sleep(0.2)
-        from gi.repository import GLib
-        GLib.idle_add(self.refresh_approval_ui)
+            log.error(f"Error calling {method_name} for {extension_id}/{instance_id}: {e}")
 
     # ========================================
     # Image Access (delegates to ImageManager)
@@ -352,10 +458,7 @@ class GoogleMeetActionBase(ActionBase):
         """
         # If connection_state is provided, determine mode automatically
         if connection_state is not None:
-            if connection_state in ["disconnected", "not_in_meeting"]:
-                mode = ImageMode.DISABLED
-            else:
-                mode = ImageMode.REGULAR
+            mode = _CONNECTION_STATE_TO_MODE.get(connection_state, ImageMode.REGULAR)
         # If mode is still None, default to REGULAR
         elif mode is None:
             mode = ImageMode.REGULAR
@@ -387,19 +490,56 @@ class GoogleMeetActionBase(ActionBase):
         """
         raise NotImplementedError("Child classes must implement render_state()")
 
+    def is_render_needed(self, render_key) -> bool:
+        """
+        Check whether rendering would change what the key currently shows.
+
+        Different states can produce identical output (e.g. the same grayed
+        out image while disconnected and while not in a meeting). Actions
+        pass a key describing their output; the render can be skipped when
+        it matches the previous one.
+
+        Args:
+            render_key: Hashable description of the rendered output
+
+        Returns:
+            True if the output differs from the last render
+        """
+        if render_key == self._last_render_key:
+            return False
+        self._last_render_key = render_key
+        return True
+
+    def set_media_and_label(self, img, size: float, label: str = None, font_size: int = None):
+        """
+        Set the key image and bottom label with a single key redraw.
+
+        The image is set without updating the key when a label follows, so
+        only the combined frame is rendered and sent to the deck.
+
+        Args:
+            img: PIL Image to show (skipped if None)
+            size: Image size passed to set_media()
+            label: Bottom label text (left unchanged if None)
+            font_size: Bottom label font size
+        """
+        if img:
+            self.set_media(image=img, size=size, update=label is None)
+        if label is not None:
+            self.set_bottom_label(label, font_size=font_size)
+
     def update_state(self):
         """
         Update action state and render if changed.
         This method is called by on_tick() and handles:
         1. Getting connection/meeting status
         2. Calling compute_state() for action-specific state
-        3. Comparing with cached state
+        3. Comparing with cached state token
         4. Calling render_state() if state changed
         """
         try:
-            # Get connection and meeting status
-            connected = self.get_connected()
-            in_meeting = self.get_in_meeting()
+            # Get connection and meeting status (single backend query)
+            connected, in_meeting = self._refresh_backend_status()
 
             # Determine connection state
             if not connected:
@@ -408,26 +548,28 @@ class GoogleMeetActionBase(ActionBase):
                 connection_state = "not_in_meeting"
             else:
                 connection_state = "connected"
-
-            # Create base state
-            base_state = {
-                "connection_state": connection_state,
-                "connected": connected,
-                "in_meeting": in_meeting
-            }
+            self._last_connection_state = connection_state
 
             # Get action-specific state from child class
             child_state = self.compute_state()
 
-            # Merge states
-            full_state = {**base_state, **child_state}
+            # Flat token describing the state; comparing it is a cheap
+            # scalar-by-scalar check instead of a dict equality walk
+            state_token = (connected, in_meeting, *sorted(child_state.items()))
 
             # Compare with cached state
-            if full_state != self._cached_state:
-                # State has changed, render it
+            if state_token != self._cached_state_token:
+                # State has changed: build the full state once, in place
+                full_state = {
+                    "connection_state": connection_state,
+                    "connected": connected,
+                    "in_meeting": in_meeting
+                }
+                full_state.update(child_state)
                 self.render_state(full_state, connection_state)
                 # Update cache
                 self._cached_state = full_state
+                self._cached_state_token = state_token
 
         except Exception as e:
             log.error(f"Error updating state: {e}")
@@ -437,12 +579,58 @@ class GoogleMeetActionBase(ActionBase):
         Called when action becomes ready (e.g., page loads).
         Clears cached state to force a fresh render.
         """
+        self._visible = True
         self._cached_state = None
+        self._cached_state_token = None
+        self._last_render_key = None
+        self.plugin_base.add_state_listener(self)
         self.update_state()
 
+    def on_backend_state_changed(self):
+        """Called by the plugin when the backend pushes a state change"""
+        if self.is_on_active_page():
+            self.update_state()
+
+    def _poll_interval(self) -> int:
+        """Number of ticks between backend polls in on_tick()"""
+        return self.WATCHDOG_POLL_INTERVAL if self.PUSH_DRIVEN else 1
+
+    def is_on_active_page(self) -> bool:
+        """Check if this action's page is the one currently shown on the deck"""
+        try:
+            return self.deck_controller.active_page is self.page
+        except AttributeError:
+            # Assume visible if the deck/page is not available
+            return True
+
     def on_tick(self):
         """
         Called periodically by StreamController.
-        Updates the action state.
+        Updates the action state, skipping hidden pages entirely. Push-driven
+        actions only poll every WATCHDOG_POLL_INTERVAL ticks.
         """
+        now = time.monotonic()
+        if now - self._last_tick < self.MIN_TICK_INTERVAL:
+            return
+        self._last_tick = now
+
+        if not self.is_on_active_page():
+            self._visible = False
+            return
+
+        if not self._visible:
+            # Back on screen: pushes were dropped while hidden, so redraw now
+            # instead of waiting for the next watchdog poll
+            self._visible = True
+            self._cached_state_token = None
+            self._last_render_key = None
+            self._idle_ticks = 0
+            self.update_state()
+            return
+
+        self._idle_ticks += 1
+        if self._idle_ticks < self._poll_interval():
+            return
+        self._idle_ticks = 0
+
         self.update_state()
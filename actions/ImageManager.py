@@ -4,7 +4,10 @@ ImageManager - Centralized image loading and caching for Google Meet plugin
 Handles all image loading, grayscale conversion, and caching at plugin startup.
 """
 
+import hashlib
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from PIL import Image, ImageOps
 from loguru import logger as log
@@ -21,49 +24,133 @@ class ImageManager:
     Manages image loading, caching, and grayscale conversion.
 
     All images are preloaded at plugin startup and stored in memory.
-    Each image is stored in two modes: REGULAR (color) and DISABLED (grayscale).
+    Each image is available in two modes: REGULAR (color) and DISABLED
+    (grayscale). DISABLED variants are derived from the regular image the
+    first time they are requested and cached from then on.
     """
 
-    # Class-level cache: {name__mode: PIL.Image}
-    _image_cache = {}
+    # Images preloaded at startup: {subdirectory: {cache name: filename}},
+    # where None is the top-level assets directory
+    _MANIFEST: dict[str | None, dict[str, str]] = {
+        None: {
+            # Common images
+            "error": "error.png",
+            "success": "success.png",
+            "failure": "failure.png",
+            # Action images
+            "mic_on": "mic_on.png",
+            "mic_off": "mic_off.png",
+            "camera_on": "camera_on.png",
+            "camera_off": "camera_off.png",
+            "hand_raised": "hand_raised.png",
+            "hand_lowered": "hand_lowered.png",
+            "leave": "leave.png",
+            "in_meeting": "in_meeting.png",
+            "participants": "participants.png",
+        },
+        "reactions": {
+            f"reaction_{reaction_id}": f"{reaction_id}.png"
+            for reaction_id in (
+                "sparkling_heart", "thumbs_up", "celebrate", "applause", "laugh",
+                "surprised", "sad", "thinking", "thumbs_down",
+            )
+        },
+    }
+
+    # Class-level cache: {(name, mode): PIL.Image}
+    _image_cache: dict[tuple[str, ImageMode], Image.Image] = {}
     _initialized = False
     _assets_path = None
 
+    # Content-addressed images: {digest of mode+size+pixels: PIL.Image}, so
+    # assets with identical pixels share one Image object
+    _interned: dict[bytes, Image.Image] = {}
+
+    # Filenames present in the assets directory, keyed by subdirectory
+    # ("" for the top level); scanned once so loads skip per-file stat()s
+    _asset_files: dict[str, set[str]] = {}
+
+    # Guards _image_cache writes and the _initialized flag; image loads
+    # run on worker threads and get_image() may fill in DISABLED variants
+    _lock = threading.Lock()
+
+    # Serializes initialize() so concurrent callers preload only once; held
+    # for the whole preload, separate from _lock which the loaders take
+    _init_lock = threading.Lock()
+
+    # Background loading (see initialize_in_background): _loading is set
+    # while it runs, _ready once it has finished, successfully or not, and
+    # get_image() waits up to INIT_WAIT_TIMEOUT seconds for it
+    _loading = False
+    _ready = threading.Event()
+    INIT_WAIT_TIMEOUT = 10.0
+
     @classmethod
-    def initialize(cls, assets_path: str):
+    def initialize_in_background(cls, assets_path: str) -> threading.Thread:
         """
-        Initialize ImageManager and preload all plugin images.
+        Run initialize() on a background thread.
 
-        This should be called once during plugin initialization.
+        Lets plugin startup continue while images decode; get_image() blocks
+        until loading has finished.
 
         Args:
             assets_path: Absolute path to the assets directory
+
+        Returns:
+            The loader thread
         """
-        if cls._initialized:
-            log.warning("ImageManager already initialized, skipping")
-            return
+        cls._loading = True
 
-        cls._assets_path = assets_path
-        log.info(f"Initializing ImageManager with assets path: {assets_path}")
+        def load():
+            try:
+                cls.initialize(assets_path)
+            except Exception:
+                pass  # Already logged by initialize()
+            finally:
+                cls._loading = False
+                cls._ready.set()
 
-        try:
-            # Preload common images
-            cls._preload_common_images()
+        thread = threading.Thread(target=load, daemon=True, name="gmeet-image-init")
+        thread.start()
+        return thread
 
-            # Preload action-specific images
-            cls._preload_mic_images()
-            cls._preload_camera_images()
-            cls._preload_hand_images()
-            cls._preload_info_images()
+    @classmethod
+    def initialize(cls, assets_path: str):
+        """
+        Initialize ImageManager and preload all plugin images.
 
-            # Preload reaction images
-            cls._preload_reaction_images()
+        This should be called once during plugin initialization.
 
-            cls._initialized = True
-            log.info(f"ImageManager initialized successfully. Loaded {len(cls._image_cache)} image variants.")
-        except Exception as e:
-            log.error(f"Error initializing ImageManager: {e}")
-            raise
+        Args:
+            assets_path: Absolute path to the assets directory
+        """
+        with cls._init_lock:
+            # Re-check under the lock: a concurrent caller may have finished
+            # preloading while we waited
+            if cls._initialized:
+                log.warning("ImageManager already initialized, skipping")
+                return
+
+            cls._assets_path = assets_path
+            log.info(f"Initializing ImageManager with assets path: {assets_path}")
+            cls._asset_files = {
+                "": cls._scan_dir(assets_path),
+                "reactions": cls._scan_dir(os.path.join(assets_path, "reactions")),
+            }
+
+            try:
+                # Decode images on a small pool; Pillow releases the GIL while
+                # decoding, and leaving the block waits for all loads to finish
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                        thread_name_prefix="gmeet-images") as executor:
+                    cls._preload_all(executor)
+
+                with cls._lock:
+                    cls._initialized = True
+                log.info(f"ImageManager initialized successfully. Loaded {len(cls._image_cache)} images.")
+            except Exception as e:
+                log.error(f"Error initializing ImageManager: {e}")
+                raise
 
     @classmethod
     def get_image(cls, name: str, mode: ImageMode = ImageMode.REGULAR) -> Image.Image:
@@ -77,111 +164,67 @@ class ImageManager:
         Returns:
             PIL Image object or None if not found
         """
+        if not cls._initialized and cls._loading:
+            # Still loading in the background
+            cls._ready.wait(cls.INIT_WAIT_TIMEOUT)
+
         if not cls._initialized:
             log.error("ImageManager not initialized. Call initialize() first.")
             return None
 
-        cache_key = f"{name}__{mode.name.lower()}"
-        img = cls._image_cache.get(cache_key)
+        img = cls._image_cache.get((name, mode))
+
+        if img is None and mode is ImageMode.DISABLED:
+            # Derive the grayscale variant from the regular image on first use
+            regular_img = cls._image_cache.get((name, ImageMode.REGULAR))
+            if regular_img is not None:
+                img = cls._intern(cls._convert_to_grayscale(regular_img))
+                with cls._lock:
+                    img = cls._image_cache.setdefault((name, mode), img)
 
         if img is None:
-            log.warning(f"Image not found in cache: {cache_key}")
+            log.warning(f"Image not found in cache: {name} ({mode.name})")
 
         return img
 
     @classmethod
-    def _preload_common_images(cls):
-        """Preload common images used by multiple actions"""
-        common_images = {
-            "error": "error.png",
-            "success": "success.png",
-            "failure": "failure.png",
-        }
-
-        for name, filename in common_images.items():
-            cls._load_image(name, filename)
-
-        log.debug(f"Preloaded {len(common_images)} common images")
-
-    @classmethod
-    def _preload_mic_images(cls):
-        """Preload microphone action images"""
-        mic_images = {
-            "mic_on": "mic_on.png",
-            "mic_off": "mic_off.png",
-        }
-
-        for name, filename in mic_images.items():
-            cls._load_image(name, filename)
-
-        log.debug(f"Preloaded {len(mic_images)} mic images")
-
-    @classmethod
-    def _preload_camera_images(cls):
-        """Preload camera action images"""
-        camera_images = {
-            "camera_on": "camera_on.png",
-            "camera_off": "camera_off.png",
-        }
-
-        for name, filename in camera_images.items():
-            cls._load_image(name, filename)
-
-        log.debug(f"Preloaded {len(camera_images)} camera images")
+    def _preload_all(cls, executor: ThreadPoolExecutor):
+        """Queue every image in _MANIFEST for loading"""
+        for subdir, images in cls._MANIFEST.items():
+            for name, filename in images.items():
+                if subdir is None:
+                    executor.submit(cls._load_image, name, filename)
+                else:
+                    executor.submit(cls._load_image_from_subdir, name, subdir, filename)
 
-    @classmethod
-    def _preload_hand_images(cls):
-        """Preload hand raising action images"""
-        hand_images = {
-            "hand_raised": "hand_raised.png",
-            "hand_lowered": "hand_lowered.png",
-        }
-
-        for name, filename in hand_images.items():
-            cls._load_image(name, filename)
-
-        log.debug(f"Preloaded {len(hand_images)} hand images")
+            log.debug(f"Queued {len(images)} images from {subdir or 'assets'}")
 
     @classmethod
-    def _preload_info_images(cls):
-        """Preload informational action images"""
-        info_images = {
-            "leave": "leave.png",
-            "in_meeting": "in_meeting.png",
-            "participants": "participants.png",
-        }
-
-        for name, filename in info_images.items():
-            cls._load_image(name, filename)
-
-        log.debug(f"Preloaded {len(info_images)} info images")
+    def _intern(cls, img: Image.Image) -> Image.Image:
+        """
+        Return the shared Image with the same pixels as img, registering img
+        if it is the first one seen.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{img.mode}:{img.size}".encode())
+        hasher.update(img.tobytes())
+        with cls._lock:
+            return cls._interned.setdefault(hasher.digest(), img)
 
-    @classmethod
-    def _preload_reaction_images(cls):
-        """Preload all reaction emoji images"""
-        reactions = [
-            "sparkling_heart",
-            "thumbs_up",
-            "celebrate",
-            "applause",
-            "laugh",
-            "surprised",
-            "sad",
-            "thinking",
-            "thumbs_down",
-        ]
-
-        for reaction_id in reactions:
-            name = f"reaction_{reaction_id}"
-            filename = f"{reaction_id}.png"
-            cls._load_image_from_subdir(name, "reactions", filename)
-
-        log.debug(f"Preloaded {len(reactions)} reaction images")
+    @staticmethod
+    def _scan_dir(path: str) -> set[str]:
+        """Return the names of the regular files in a directory (empty if missing)"""
+        try:
+            with os.scandir(path) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError as e:
+            log.warning(f"Could not scan assets directory {path}: {e}")
+            return set()
 
     @classmethod
     def _load_image(cls, name: str, filename: str):
         """
-        Load an image from assets directory and create both regular and disabled variants.
+        Load an image from assets directory into the cache.
 
         Args:
             name: Cache key name (e.g., "mic_on")
@@ -189,19 +232,18 @@ class ImageManager:
         """
         path = os.path.join(cls._assets_path, filename)
 
-        if not os.path.exists(path):
+        if filename not in cls._asset_files.get("", ()):
             log.warning(f"Image file not found: {path}")
             return
 
         try:
             with Image.open(path) as img:
-                # Store regular (color) version
-                regular_img = img.copy()
-                cls._image_cache[f"{name}__regular"] = regular_img
-
-                # Create and store disabled (grayscale) version
-                disabled_img = cls._convert_to_grayscale(regular_img)
-                cls._image_cache[f"{name}__disabled"] = disabled_img
+                # Decode once and keep the decoded image itself; the disabled
+                # (grayscale) variant is derived on first use in get_image()
+                img.load()
+                img = cls._intern(img)
+                with cls._lock:
+                    cls._image_cache[(name, ImageMode.REGULAR)] = img
 
                 log.debug(f"Loaded image: {name} from {filename}")
         except Exception as e:
@@ -210,7 +252,7 @@ class ImageManager:
     @classmethod
     def _load_image_from_subdir(cls, name: str, subdir: str, filename: str):
         """
-        Load an image from a subdirectory and create both regular and disabled variants.
+        Load an image from a subdirectory into the cache.
 
         Args:
             name: Cache key name (e.g., "reaction_thumbs_up")
@@ -219,19 +261,18 @@ class ImageManager:
         """
         path = os.path.join(cls._assets_path, subdir, filename)
 
-        if not os.path.exists(path):
+        if filename not in cls._asset_files.get(subdir, ()):
             log.warning(f"Image file not found: {path}")
             return
 
         try:
             with Image.open(path) as img:
-                # Store regular (color) version
-                regular_img = img.copy()
-                cls._image_cache[f"{name}__regular"] = regular_img
-
-                # Create and store disabled (grayscale) version
-                disabled_img = cls._convert_to_grayscale(regular_img)
-                cls._image_cache[f"{name}__disabled"] = disabled_img
+                # Decode once and keep the decoded image itself; the disabled
+                # (grayscale) variant is derived on first use in get_image()
+                img.load()
+                img = cls._intern(img)
+                with cls._lock:
+                    cls._image_cache[(name, ImageMode.REGULAR)] = img
 
                 log.debug(f"Loaded image: {name} from {subdir}/{filename}")
         except Exception as e:
@@ -251,14 +292,10 @@ class ImageManager:
         # Convert to grayscale and back to RGB to maintain compatibility
         # This preserves the RGBA mode if original has alpha channel
         if img.mode == 'RGBA':
-            # Handle images with alpha channel
+            # Handle images with alpha channel: merge the luma band into
+            # R, G and B and keep the original alpha, in a single C pass
             grayscale = ImageOps.grayscale(img)
-            # Convert back to RGBA
-            result = Image.new('RGBA', img.size)
-            result.paste(grayscale.convert('RGB'), (0, 0))
-            # Preserve alpha channel
-            result.putalpha(img.getchannel('A'))
-            return result
+            return Image.merge('RGBA', (grayscale, grayscale, grayscale, img.getchannel('A')))
         else:
             # For RGB images, convert to grayscale and back to RGB
             grayscale = ImageOps.grayscale(img)
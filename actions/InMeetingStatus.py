@@ -19,14 +19,15 @@ class InMeetingStatus(GoogleMeetActionBase):
 
         # Get image based on meeting status
         img = self.get_image("in_meeting", connection_state)
-        if img:
-            self.set_media(image=img, size=0.90)
 
-        # Set label based on meeting status
+        if not self.is_render_needed((img, in_meeting)):
+            return
+
+        # Set image and label based on meeting status in one redraw
         if in_meeting:
-            self.set_bottom_label("IN MEETING", font_size=11)
+            self.set_media_and_label(img, 0.90, "IN MEETING", font_size=11)
         else:
-            self.set_bottom_label("NOT IN MEETING", font_size=10)
+            self.set_media_and_label(img, 0.90, "NOT IN MEETING", font_size=10)
 
     def on_key_down(self):
         """Called when button is pressed - does nothing (informational only)"""
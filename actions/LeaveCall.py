@@ -17,6 +17,10 @@ class LeaveCall(GoogleMeetActionBase):
         """Render leave call button"""
         # Get leave button image
         img = self.get_image("leave", connection_state)
+
+        if not self.is_render_needed(img):
+            return
+
         if img:
             self.set_media(image=img, size=0.9)
 
@@ -25,8 +29,11 @@ class LeaveCall(GoogleMeetActionBase):
         if not self.get_connected() or not self.get_in_meeting():
             return
 
+        self._executor.submit(self._leave_call)
+
+    def _leave_call(self):
+        """Ask the backend to leave the call (runs on the worker pool)"""
         try:
-            # Leave the call
             self.plugin_base.backend.leave_call()
             log.info("Left meeting")
         except Exception as e:
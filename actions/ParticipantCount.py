@@ -6,23 +6,18 @@ This is a read-only action that does not perform any action when clicked.
 """
 
 from .GoogleMeetActionBase import GoogleMeetActionBase
-from loguru import logger as log
 
 
 class ParticipantCount(GoogleMeetActionBase):
     """Action to display participant count (informational only)"""
 
-    def compute_state(self) -> dict:
-        """Get participant count from backend"""
-        try:
-            if self.plugin_base.backend is None:
-                return {"participant_count": None}
+    # Label font size indexed by the number of digits (4 or more share the last)
+    FONT_SIZE_BY_DIGITS = (22, 22, 20, 18, 16)
 
-            count = self.plugin_base.backend.get_participant_count()
-            return {"participant_count": count}
-        except Exception as e:
-            log.error(f"Error getting participant count: {e}")
-            return {"participant_count": None}
+    def compute_state(self) -> dict:
+        """Get participant count from the shared backend snapshot"""
+        snapshot = self.plugin_base.get_backend_snapshot()
+        return {"participant_count": snapshot.get("participant_count")}
 
     def render_state(self, state: dict, connection_state: str):
         """Render participant count display"""
@@ -31,30 +26,20 @@ class ParticipantCount(GoogleMeetActionBase):
         # Show error state if count is unknown
         if count is None:
             img = self.get_image("error", connection_state)
-            if img:
-                self.set_media(image=img, size=0.90)
-            self.set_bottom_label("--", font_size=22)
+            if self.is_render_needed((img, None)):
+                self.set_media_and_label(img, 0.90, "--", font_size=22)
             return
 
         # Show participant count
         img = self.get_image("participants", connection_state)
-        if img:
-            self.set_media(image=img, size=0.75)
+        if not self.is_render_needed((img, count)):
+            return
 
-        # Format count as string
+        # Format count as string, shrinking the font as it gets longer
         count_str = str(count)
+        font_size = self.FONT_SIZE_BY_DIGITS[min(len(count_str), 4)]
 
-        # Adjust font size based on number length
-        if count >= 1000:
-            font_size = 16
-        elif count >= 100:
-            font_size = 18
-        elif count >= 10:
-            font_size = 20
-        else:
-            font_size = 22
-
-        self.set_bottom_label(count_str, font_size=font_size)
+        self.set_media_and_label(img, 0.75, count_str, font_size=font_size)
 
     def on_key_down(self):
         """Called when button is pressed - does nothing (informational only)"""
@@ -11,7 +11,7 @@ class RaiseHand(ToggleStateAction):
     # Configuration for ToggleStateAction
     IMAGE_NAME_ON = "hand_raised"
     IMAGE_NAME_OFF = "hand_lowered"
-    BACKEND_STATE_METHOD = "get_hand_raised"
+    SNAPSHOT_FIELD = "hand_raised"
     BACKEND_TOGGLE_METHOD = "toggle_hand"
     LABEL_ON = ""
     LABEL_OFF = ""
@@ -5,7 +5,7 @@ from loguru import logger as log
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw
+from gi.repository import Gtk, Adw, GLib
 
 
 class SendReaction(GoogleMeetActionBase):
@@ -24,10 +24,24 @@ class SendReaction(GoogleMeetActionBase):
         "thumbs_down": "👎",
     }
 
+    # Reaction ids in combo row order, and each id's position
+    REACTION_IDS = tuple(REACTIONS)
+    REACTION_INDEX = {reaction_id: index for index, reaction_id in enumerate(REACTION_IDS)}
+
+    # Delay (ms) before a reaction change is saved, so scrolling through the
+    # combo row does not write settings for every reaction passed
+    REACTION_CHANGE_DEBOUNCE_MS = 200
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.reaction = "thumbs_up"
 
+        # Pending GLib source for a debounced reaction change
+        self._reaction_change_source = None
+
+        # Reaction selector, built with the first config rows and reused
+        self.reaction_row = None
+
     def compute_state(self) -> dict:
         """Get current reaction selection from settings"""
         settings = self.get_settings()
@@ -41,7 +55,7 @@ class SendReaction(GoogleMeetActionBase):
 
         # Get reaction image
         img = self.get_image(f"reaction_{reaction}", connection_state)
-        if img:
+        if img and self.is_render_needed(img):
             self.set_media(image=img, size=0.8)
 
     def on_key_down(self):
@@ -51,9 +65,13 @@ class SendReaction(GoogleMeetActionBase):
             self.show_error(duration=2.0)
             return
 
+        self._executor.submit(self._send_reaction, self.reaction)
+
+    def _send_reaction(self, reaction: str):
+        """Send a reaction through the backend (runs on the worker pool)"""
         try:
-            # Send reaction
-            self.plugin_base.backend.send_reaction(self.reaction)
+            if not self.plugin_base.backend.send_reaction(reaction):
+                self.show_error(duration=3.0)
         except Exception as e:
             log.error(f"Error sending reaction: {e}")
             self.show_error(duration=3.0)
@@ -63,20 +81,26 @@ class SendReaction(GoogleMeetActionBase):
         super_rows = super().get_config_rows()
 
         # Reaction selector
-        self.reaction_model = Gtk.StringList()
-        for reaction_id, reaction_name in self.REACTIONS.items():
-            self.reaction_model.append(reaction_name)
-
-        self.reaction_row = Adw.ComboRow(
-            model=self.reaction_model,
-            title="Reaction"
-        )
-
-        # Load current selection
-        self.load_reaction_config()
-
-        # Connect signal
-        self.reaction_row.connect("notify::selected", self.on_reaction_changed)
+        if self.reaction_row is None:
+            self.reaction_model = Gtk.StringList()
+            for reaction_id, reaction_name in self.REACTIONS.items():
+                self.reaction_model.append(reaction_name)
+
+            self.reaction_row = Adw.ComboRow(
+                model=self.reaction_model,
+                title="Reaction"
+            )
+
+            # Load current selection
+            self.load_reaction_config()
+
+            # Connect signal
+            self.reaction_row.connect("notify::selected", self.on_reaction_changed)
+        else:
+            # Reopened config: detach the row from the previous config area
+            parent = self.reaction_row.get_parent()
+            if parent is not None:
+                parent.remove(self.reaction_row)
 
         super_rows.append(self.reaction_row)
         return super_rows
@@ -86,23 +110,36 @@ class SendReaction(GoogleMeetActionBase):
         reaction = self.get_settings().get("reaction", "thumbs_up")
 
         # Find index in REACTIONS
-        reaction_ids = list(self.REACTIONS.keys())
-        if reaction in reaction_ids:
-            index = reaction_ids.index(reaction)
+        index = self.REACTION_INDEX.get(reaction)
+        if index is not None:
             self.reaction_row.set_selected(index)
 
     def on_reaction_changed(self, row, *args):
-        """Handle reaction change"""
+        """Handle reaction change (debounced while the selection is still moving)"""
         selected_index = row.get_selected()
-        reaction_ids = list(self.REACTIONS.keys())
 
-        if 0 <= selected_index < len(reaction_ids):
-            self.reaction = reaction_ids[selected_index]
+        if not 0 <= selected_index < len(self.REACTION_IDS):
+            return
+
+        if self._reaction_change_source is not None:
+            GLib.source_remove(self._reaction_change_source)
+
+        self._reaction_change_source = GLib.timeout_add(
+            self.REACTION_CHANGE_DEBOUNCE_MS, self._apply_reaction_change, self.REACTION_IDS[selected_index]
+        )
+
+    def _apply_reaction_change(self, reaction: str) -> bool:
+        """Save the selected reaction and re-render with it"""
+        self._reaction_change_source = None
+        self.reaction = reaction
+
+        # Save to settings
+        settings = self.get_settings()
+        settings["reaction"] = reaction
+        self.set_settings(settings)
 
-            # Save to settings
-            settings = self.get_settings()
-            settings["reaction"] = self.reaction
-            self.set_settings(settings)
+        # Re-render with the new reaction; off the GTK thread, since a stale
+        # backend snapshot is refreshed over RPC
+        self._executor.submit(self.update_state)
 
-            # Force state update to re-render with new reaction
-            self.update_state()
+        return False
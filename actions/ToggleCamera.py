@@ -11,7 +11,7 @@ class ToggleCamera(ToggleStateAction):
     # Configuration for ToggleStateAction
     IMAGE_NAME_ON = "camera_on"
     IMAGE_NAME_OFF = "camera_off"
-    BACKEND_STATE_METHOD = "get_camera_enabled"
+    SNAPSHOT_FIELD = "camera_enabled"
     BACKEND_TOGGLE_METHOD = "toggle_camera"
     LABEL_ON = ""
     LABEL_OFF = ""
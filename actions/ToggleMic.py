@@ -11,7 +11,7 @@ class ToggleMic(ToggleStateAction):
     # Configuration for ToggleStateAction
     IMAGE_NAME_ON = "mic_on"
     IMAGE_NAME_OFF = "mic_off"
-    BACKEND_STATE_METHOD = "get_mic_enabled"
+    SNAPSHOT_FIELD = "mic_enabled"
     BACKEND_TOGGLE_METHOD = "toggle_microphone"
     LABEL_ON = ""
     LABEL_OFF = ""
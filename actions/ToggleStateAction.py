@@ -8,6 +8,8 @@ with automatic state synchronization from the backend.
 from .GoogleMeetActionBase import GoogleMeetActionBase
 from loguru import logger as log
 
+from gi.repository import GLib
+
 
 class ToggleStateAction(GoogleMeetActionBase):
     """
@@ -16,7 +18,7 @@ class ToggleStateAction(GoogleMeetActionBase):
     Subclasses must define these class attributes:
     - IMAGE_NAME_ON: str - Image name for ON state (e.g., "mic_on")
     - IMAGE_NAME_OFF: str - Image name for OFF state (e.g., "mic_off")
-    - BACKEND_STATE_METHOD: str - Backend method name to query state (e.g., "get_mic_enabled")
+    - SNAPSHOT_FIELD: str - Backend state snapshot field holding the state (e.g., "mic_enabled")
     - BACKEND_TOGGLE_METHOD: str - Backend method name to toggle (e.g., "toggle_microphone")
     - LABEL_ON: str - Label text for ON state (e.g., "ON") - optional
     - LABEL_OFF: str - Label text for OFF state (e.g., "OFF") - optional
@@ -25,11 +27,14 @@ class ToggleStateAction(GoogleMeetActionBase):
     # Subclasses must override these
     IMAGE_NAME_ON = None
     IMAGE_NAME_OFF = None
-    BACKEND_STATE_METHOD = None
+    SNAPSHOT_FIELD = None
     BACKEND_TOGGLE_METHOD = None
     LABEL_ON = None
     LABEL_OFF = None
 
+    # Delay before re-checking the backend after a toggle was sent (ms)
+    TOGGLE_CONFIRM_DELAY_MS = 1000
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -37,68 +42,103 @@ class ToggleStateAction(GoogleMeetActionBase):
         if not all([
             self.IMAGE_NAME_ON,
             self.IMAGE_NAME_OFF,
-            self.BACKEND_STATE_METHOD,
+            self.SNAPSHOT_FIELD,
             self.BACKEND_TOGGLE_METHOD
         ]):
             raise ValueError(
                 f"{self.__class__.__name__} must define IMAGE_NAME_ON, IMAGE_NAME_OFF, "
-                "BACKEND_STATE_METHOD, and BACKEND_TOGGLE_METHOD"
+                "SNAPSHOT_FIELD, and BACKEND_TOGGLE_METHOD"
             )
 
-    def compute_state(self) -> dict:
-        """Get toggle state from backend"""
-        try:
-            if self.plugin_base.backend is None:
-                return {"toggle_enabled": None}
+        # (image name, label) to render per toggle state; None is unknown
+        self._render_table = {
+            True: (self.IMAGE_NAME_ON, self.LABEL_ON or None),
+            False: (self.IMAGE_NAME_OFF, self.LABEL_OFF or None),
+            None: ("error", None),
+        }
+
+        # Backend toggle method and the backend it was resolved on; looking
+        # it up on the backend proxy is itself a round-trip
+        self._toggle_method = None
+        self._toggle_method_backend = None
+
+    def _get_toggle_method(self):
+        """Resolve the backend toggle method once per backend instance"""
+        backend = self.plugin_base.backend
+        if backend is not self._toggle_method_backend:
+            self._toggle_method = getattr(backend, self.BACKEND_TOGGLE_METHOD)
+            self._toggle_method_backend = backend
+        return self._toggle_method
 
-            # Query state from backend using configured method
-            backend_method = getattr(self.plugin_base.backend, self.BACKEND_STATE_METHOD)
-            toggle_enabled = backend_method()
-            return {"toggle_enabled": toggle_enabled}
-        except Exception as e:
-            log.error(f"Error getting {self.__class__.__name__} state: {e}")
-            return {"toggle_enabled": None}
+    def compute_state(self) -> dict:
+        """Get toggle state from the shared backend snapshot"""
+        snapshot = self.plugin_base.get_backend_snapshot()
+        return {"toggle_enabled": snapshot.get(self.SNAPSHOT_FIELD)}
 
     def render_state(self, state: dict, connection_state: str):
         """Render toggle button based on state"""
         toggle_enabled = state.get("toggle_enabled")
+        if toggle_enabled is not None:
+            toggle_enabled = bool(toggle_enabled)
 
-        # Show error state if toggle state is unknown
-        if toggle_enabled is None:
-            img = self.get_image("error", connection_state)
-            if img:
-                self.set_media(image=img, size=0.9)
-            return
-
-        # Select appropriate image based on toggle state
-        if toggle_enabled:
-            img = self.get_image(self.IMAGE_NAME_ON, connection_state)
-            label = self.LABEL_ON
-        else:
-            img = self.get_image(self.IMAGE_NAME_OFF, connection_state)
-            label = self.LABEL_OFF
+        # Select image and label for the toggle state (error image if unknown)
+        image_name, label = self._render_table[toggle_enabled]
+        img = self.get_image(image_name, connection_state)
 
-        # Set image
-        if img:
-            self.set_media(image=img, size=0.9)
+        if not self.is_render_needed((img, label)):
+            return
 
-        # Set label if provided
-        if label:
-            self.set_bottom_label(label, font_size=14)
+        # Set image and label (if provided) in one redraw
+        self.set_media_and_label(img, 0.9, label, font_size=14)
 
     def on_key_down(self):
         """Toggle when button is pressed"""
         if not self.get_connected() or not self.get_in_meeting():
             return
 
-        try:
-            if self.plugin_base.backend is None:
-                return
+        if self.plugin_base.backend is None:
+            return
 
+        # Show the expected state right away instead of after the round-trip
+        previous_state = self._cached_state
+        if previous_state is not None and previous_state.get("toggle_enabled") is not None:
+            predicted_state = dict(previous_state, toggle_enabled=not previous_state["toggle_enabled"])
+            self.render_state(predicted_state, self._last_connection_state)
+            self._cached_state = predicted_state
+            # Render the backend's state on the next update even if unchanged
+            self._cached_state_token = None
+
+        self._executor.submit(self._send_toggle)
+
+    def _send_toggle(self):
+        """Send the toggle to the backend; revert the optimistic state on failure"""
+        try:
             # Toggle using configured backend method
-            backend_method = getattr(self.plugin_base.backend, self.BACKEND_TOGGLE_METHOD)
-            backend_method()
-            # Force immediate state update
-            self.update_state()
+            success = self._get_toggle_method()()
         except Exception as e:
             log.error(f"Error toggling {self.__class__.__name__}: {e}")
+            success = False
+
+        # Expect a state change: re-query instead of using the shared snapshot
+        self.plugin_base.invalidate_backend_snapshot()
+
+        if not success:
+            # Roll back to whatever the backend reports, then flag the failure
+            self.update_state()
+            self.show_error(duration=2.0)
+            return
+
+        # Success only means the command was scheduled; if the meeting never
+        # applies it, this re-check rolls the optimistic state back
+        GLib.timeout_add(self.TOGGLE_CONFIRM_DELAY_MS, self._confirm_toggle)
+
+    def _confirm_toggle(self) -> bool:
+        """
+        Re-query the backend once the toggle has had time to apply.
+
+        Returns:
+            False so GLib.timeout_add does not reschedule it
+        """
+        self.plugin_base.invalidate_backend_snapshot()
+        self._executor.submit(self.update_state)
+        return False
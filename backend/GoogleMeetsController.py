@@ -1,13 +1,91 @@
 import asyncio
+import functools
 import json
+import operator
 import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Dict, Optional, Callable, Any
 from loguru import logger as log
 import websockets
 from websockets.server import WebSocketServerProtocol
+from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePublicKey
 
 from auth import CryptoManager, PairingManager, PairingRequest
 
+# Use orjson for message framing when available; its errors subclass
+# json.JSONDecodeError. Frames are sent as text, which the extension expects
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Run the server loop on uvloop when available; only the server thread's
+# loop is replaced, the global event loop policy is left alone
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+
+def _error_frame(error_code: str, message: str) -> str:
+    """Encode an error frame"""
+    return _json_dumps({"type": "error", "error_code": error_code, "message": message})
+
+
+# Constant frames, encoded once
+_FRAME_MISSING_EXTENSION_ID = _error_frame("missing_field", "Missing extension_id in handshake")
+_FRAME_MISSING_INSTANCE_ID = _error_frame("missing_field", "Missing instance_id in handshake")
+_FRAME_MISSING_PUBLIC_KEY = _error_frame("missing_field", "Missing public_key in handshake")
+_FRAME_INVALID_KEY = _error_frame("invalid_key", "Invalid public key format")
+_FRAME_NOT_AUTHORIZED = _error_frame("not_authorized", "Invalid signature or not authorized")
+_FRAME_TYPE_MISMATCH = _error_frame("type_mismatch", "Token was not signed for this message type")
+_FRAME_MESSAGE_TOO_LARGE = _error_frame("message_too_large", "Token exceeds the maximum size")
+_FRAME_HANDSHAKE_ALREADY_AUTHORIZED = _json_dumps({"type": "handshake_success", "message": "Already authorized"})
+_FRAME_HANDSHAKE_APPROVED = _json_dumps({"type": "handshake_success", "message": "Pairing approved"})
+_FRAME_HANDSHAKE_PENDING = _json_dumps({"type": "handshake_pending", "message": "Awaiting user approval"})
+_FRAME_HANDSHAKE_DENIED = _json_dumps({"type": "handshake_denied", "message": "User denied pairing"})
+_FRAME_HANDSHAKE_TIMEOUT = _json_dumps({"type": "handshake_timeout", "message": "Approval request timed out"})
+_FRAME_HEARTBEAT_ACK = _json_dumps({"type": "heartbeat_ack"})
+
+# Frames for commands that carry no data, keyed by action
+_COMMAND_FRAMES = {
+    action: _json_dumps({"type": "command", "action": action, "data": {}})
+    for action in ("toggle_mic", "toggle_camera", "toggle_hand", "leave_call")
+}
+
+# Meeting state before the extension reports anything (and after it leaves)
+_INITIAL_STATE = {
+    "mic_enabled": False,
+    "camera_enabled": False,
+    "hand_raised": False,
+    "in_meeting": False,
+    "meeting_id": None,
+    "meeting_name": None,
+    "participant_count": 0,
+}
+
+# State fields the extension may update
+_STATE_KEYS = frozenset(_INITIAL_STATE)
+
+# Fields every authenticated message must carry
+_get_auth_fields = operator.itemgetter("extension_id", "instance_id", "token")
+
+# Size limits. A signed message carries the state twice (in data and in the
+# token). With meeting_name capped at 256 characters by the extension, the
+# worst case is about 3 KiB of token and 5 KiB of message. Older extensions
+# send names uncapped, so the limits leave several times that. Oversized
+# tokens get a message_too_large error; frames over the websocket limit are
+# closed with 1009, so that limit is set well above any real state.
+_MAX_JWS_LEN = 16 * 1024
+_MAX_MESSAGE_SIZE = 64 * 1024
+
 
 class GoogleMeetsController:
     """
@@ -21,63 +99,101 @@ class GoogleMeetsController:
     - Command forwarding to extension
     """
 
+    __slots__ = (
+        "host", "port", "server", "loop", "_thread", "connected",
+        "crypto", "pairing", "_verify_pool",
+        "active_connection", "extension_id", "instance_id", "_session_public_key",
+        "current_state", "state_update_callbacks", "pending_approval", "_message_handlers",
+    )
+
     def __init__(self, host: str = "127.0.0.1", port: int = 8765):
         self.host = host
         self.port = port
         self.server = None
         self.loop = None
+        self._thread = None
         self.connected = False
 
         # Authentication managers
         self.crypto = CryptoManager()
         self.pairing = PairingManager()
 
+        # Workers for JWS verification, so ES256 checks don't block the event
+        # loop (OpenSSL releases the GIL while verifying)
+        self._verify_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jws_verify")
+
         # Client management
         self.active_connection: Optional[WebSocketServerProtocol] = None
         self.extension_id: Optional[str] = None
         self.instance_id: Optional[str] = None
 
+        # Loaded public key of the active session, so its messages skip the
+        # authorization lookups; cleared on disconnect and revocation
+        self._session_public_key: Optional[EllipticCurvePublicKey] = None
+
         # State tracking
-        self.current_state = {
-            "mic_enabled": False,
-            "camera_enabled": False,
-            "hand_raised": False,
-            "in_meeting": False,
-            "meeting_id": None,
-            "meeting_name": None,
-            "participant_count": 0,
-        }
+        self.current_state = dict(_INITIAL_STATE)
 
-        # Callbacks for state updates
-        self.state_update_callbacks: list[Callable] = []
+        # State update callbacks, each with the executor it runs on (None to
+        # run inline on the event loop thread)
+        self.state_update_callbacks: Dict[Callable, Optional[Executor]] = {}
 
         # Pending pairing approval requests (key: (extension_id, instance_id))
         self.pending_approval: Dict[tuple[str, str], asyncio.Future] = {}
 
-    def add_state_update_callback(self, callback: Callable[[Dict], None]):
-        """Register callback for state updates"""
-        self.state_update_callbacks.append(callback)
+        # Handlers for authenticated message types: handler(websocket, data)
+        self._message_handlers: Dict[str, Callable] = {
+            "state": self._handle_state_update,
+            "heartbeat": self._handle_heartbeat,
+            "command_response": self._handle_command_response,
+        }
+
+    def add_state_update_callback(self, callback: Callable[[Dict], None], executor: Optional[Executor] = None):
+        """
+        Register callback for state updates.
+
+        All callbacks receive the same state dict; they must not modify it.
+        Callbacks that block (RPCs, I/O) should pass an executor so they don't
+        stall the WebSocket event loop; they then run there in submission order
+        if the executor has a single worker.
+        """
+        self.state_update_callbacks[callback] = executor
 
     def remove_state_update_callback(self, callback: Callable[[Dict], None]):
         """Unregister callback for state updates"""
-        if callback in self.state_update_callbacks:
-            self.state_update_callbacks.remove(callback)
+        self.state_update_callbacks.pop(callback, None)
 
     def _notify_state_update(self):
         """Notify all callbacks of state update"""
-        for callback in self.state_update_callbacks:
-            try:
-                callback(self.current_state.copy())
-            except Exception as e:
-                log.error(f"Error in state update callback: {e}")
+        # One copy shared by all callbacks, detached from later updates
+        state = self.current_state.copy()
+        for callback, executor in tuple(self.state_update_callbacks.items()):
+            if executor is None:
+                self._run_state_callback(callback, state)
+            else:
+                executor.submit(self._run_state_callback, callback, state)
+
+    @staticmethod
+    def _run_state_callback(callback: Callable[[Dict], None], state: Dict[str, Any]):
+        """Run a state update callback, logging any error"""
+        try:
+            callback(state)
+        except Exception as e:
+            log.error(f"Error in state update callback: {e}")
 
     def revoke_instance(self, extension_id: str, instance_id: str):
         """Revoke approval for an instance"""
         self.pairing.revoke_instance(extension_id, instance_id)
 
         # Disconnect if currently connected
-        if self.extension_id == extension_id and self.instance_id == instance_id and self.active_connection:
-            asyncio.create_task(self.active_connection.close(1000, "Instance revoked"))
+        if self.extension_id == extension_id and self.instance_id == instance_id:
+            self._session_public_key = None
+            if self.active_connection and self.loop:
+                # Called from the backend thread, not the event loop
+                asyncio.run_coroutine_threadsafe(
+                    self.active_connection.close(1000, "Instance revoked"),
+                    self.loop
+                )
 
     def request_approval(self, pairing_request: PairingRequest) -> asyncio.Future:
         """
@@ -120,10 +236,13 @@ class GoogleMeetsController:
                 future.set_result(False)
         log.info(f"Instance denied: {extension_id}/{instance_id}")
 
-    def _verify_message(self, data: Dict) -> Optional[Dict]:
+    async def _verify_message(self, data: Dict) -> Optional[Dict]:
         """
         Verify JWS signature and extract payload
 
+        The signature must cover the message's instance_id; the caller checks
+        the signed message type.
+
         Args:
             data: Message data with token field
 
@@ -131,38 +250,61 @@ class GoogleMeetsController:
             Decoded payload if valid, None otherwise
         """
         # Extract fields
-        extension_id = data.get("extension_id")
-        instance_id = data.get("instance_id")
-        token = data.get("token")
+        try:
+            extension_id, instance_id, token = _get_auth_fields(data)
+        except KeyError:
+            log.error("Missing required fields in message")
+            return None
 
         if not extension_id or not instance_id or not token:
             log.error("Missing required fields in message")
             return None
 
-        # Check if instance is authorized
-        if not self.pairing.is_authorized(extension_id, instance_id):
-            log.error(f"Unauthorized instance: {extension_id}/{instance_id}")
+        # Reject malformed tokens before any crypto work
+        if not isinstance(token, str) or token.count(".") != 2:
+            log.error("Malformed token")
             return None
 
-        # Get public key
-        public_key = self.pairing.get_public_key(extension_id, instance_id)
-        if not public_key:
-            log.error(f"No public key found for {extension_id}/{instance_id}")
-            return None
-
-        # Verify JWS signature
-        payload = self.crypto.verify_jws(token, public_key)
+        if (extension_id == self.extension_id and instance_id == self.instance_id
+                and self._session_public_key is not None):
+            # Active session: authorized at handshake, key already looked up
+            public_key = self._session_public_key
+        else:
+            # Get public key (None if the instance is not authorized)
+            public_key_jwk = self.pairing.get_public_key(extension_id, instance_id)
+            if not public_key_jwk:
+                log.error(f"Unauthorized instance: {extension_id}/{instance_id}")
+                return None
+
+            public_key = self.crypto.validate_and_load_public_key(public_key_jwk)
+            if public_key is None:
+                log.error(f"Stored public key is invalid for {extension_id}/{instance_id}")
+                return None
+
+        # Verify JWS signature and that it covers the claimed instance
+        payload = await asyncio.get_running_loop().run_in_executor(
+            self._verify_pool,
+            functools.partial(
+                self.crypto.verify_jws,
+                token, public_key, expected_instance_id=instance_id
+            )
+        )
         if not payload:
             log.error(f"JWS verification failed for {extension_id}/{instance_id}")
             return None
 
-        # Verify instance_id matches
-        if payload.get("instance_id") != instance_id:
-            log.error("Instance ID mismatch in JWT payload")
-            return None
-
         return payload
 
+    def _start_session(self, websocket: WebSocketServerProtocol, extension_id: str, instance_id: str,
+                       public_key: EllipticCurvePublicKey):
+        """Make an authorized instance the active connection"""
+        self.extension_id = extension_id
+        self.instance_id = instance_id
+        self._session_public_key = public_key
+        self.active_connection = websocket
+        self.connected = True
+        self._notify_state_update()
+
     async def _handle_handshake(self, websocket: WebSocketServerProtocol, data: Dict) -> bool:
         """
         Handle pairing/handshake protocol:
@@ -180,36 +322,21 @@ class GoogleMeetsController:
 
         # Validate required fields
         if not extension_id:
-            await websocket.send(json.dumps({
-                "type": "error",
-                "error_code": "missing_field",
-                "message": "Missing extension_id in handshake"
-            }))
+            await websocket.send(_FRAME_MISSING_EXTENSION_ID)
             return False
 
         if not instance_id:
-            await websocket.send(json.dumps({
-                "type": "error",
-                "error_code": "missing_field",
-                "message": "Missing instance_id in handshake"
-            }))
+            await websocket.send(_FRAME_MISSING_INSTANCE_ID)
             return False
 
         if not public_key:
-            await websocket.send(json.dumps({
-                "type": "error",
-                "error_code": "missing_field",
-                "message": "Missing public_key in handshake"
-            }))
+            await websocket.send(_FRAME_MISSING_PUBLIC_KEY)
             return False
 
-        # Validate public key format
-        if not self.crypto.validate_public_key(public_key):
-            await websocket.send(json.dumps({
-                "type": "error",
-                "error_code": "invalid_key",
-                "message": "Invalid public key format"
-            }))
+        # Validate public key format; the loaded key verifies this session
+        public_key_obj = self.crypto.validate_and_load_public_key(public_key)
+        if public_key_obj is None:
+            await websocket.send(_FRAME_INVALID_KEY)
             return False
 
         # Create/update pairing request
@@ -221,17 +348,16 @@ class GoogleMeetsController:
         )
 
         # Check if already authorized
-        if self.pairing.is_authorized(extension_id, instance_id):
+        authorized_key = self.pairing.get_public_key(extension_id, instance_id)
+        if authorized_key is not None:
             log.info(f"Instance already authorized: {extension_id}/{instance_id}")
-            self.extension_id = extension_id
-            self.instance_id = instance_id
-            self.active_connection = websocket
-            self.connected = True
-
-            await websocket.send(json.dumps({
-                "type": "handshake_success",
-                "message": "Already authorized"
-            }))
+            # Sessions verify against the key stored at approval, which may
+            # differ from the one sent in this handshake
+            if authorized_key != public_key:
+                public_key_obj = self.crypto.validate_and_load_public_key(authorized_key)
+            self._start_session(websocket, extension_id, instance_id, public_key_obj)
+
+            await websocket.send(_FRAME_HANDSHAKE_ALREADY_AUTHORIZED)
             return True
 
         # Request approval from user
@@ -239,69 +365,58 @@ class GoogleMeetsController:
         approval_future = self.request_approval(pairing_request)
 
         # Send pending response
-        await websocket.send(json.dumps({
-            "type": "handshake_pending",
-            "message": "Awaiting user approval"
-        }))
+        await websocket.send(_FRAME_HANDSHAKE_PENDING)
 
         # Wait for approval (with timeout)
         try:
             approved = await asyncio.wait_for(approval_future, timeout=60.0)
             if not approved:
-                await websocket.send(json.dumps({
-                    "type": "handshake_denied",
-                    "message": "User denied pairing"
-                }))
+                await websocket.send(_FRAME_HANDSHAKE_DENIED)
                 return False
         except asyncio.TimeoutError:
-            await websocket.send(json.dumps({
-                "type": "handshake_timeout",
-                "message": "Approval request timed out"
-            }))
+            await websocket.send(_FRAME_HANDSHAKE_TIMEOUT)
             return False
 
         # Pairing approved
-        self.extension_id = extension_id
-        self.instance_id = instance_id
-        self.active_connection = websocket
-        self.connected = True
+        self._start_session(websocket, extension_id, instance_id, public_key_obj)
 
-        await websocket.send(json.dumps({
-            "type": "handshake_success",
-            "message": "Pairing approved"
-        }))
+        await websocket.send(_FRAME_HANDSHAKE_APPROVED)
 
         log.info(f"Handshake successful with {extension_id} (instance: {instance_id})")
         return True
 
-    async def _handle_state_update(self, data: Dict):
+    async def _handle_state_update(self, websocket: WebSocketServerProtocol, data: Dict):
         """Handle state update from extension"""
-        state_data = data.get("data", {})
-
-        # Update internal state
-        if "mic_enabled" in state_data:
-            self.current_state["mic_enabled"] = state_data["mic_enabled"]
-        if "camera_enabled" in state_data:
-            self.current_state["camera_enabled"] = state_data["camera_enabled"]
-        if "hand_raised" in state_data:
-            self.current_state["hand_raised"] = state_data["hand_raised"]
-        if "in_meeting" in state_data:
-            self.current_state["in_meeting"] = state_data["in_meeting"]
-        if "meeting_id" in state_data:
-            self.current_state["meeting_id"] = state_data["meeting_id"]
-        if "meeting_name" in state_data:
-            self.current_state["meeting_name"] = state_data["meeting_name"]
-        if "participant_count" in state_data:
-            self.current_state["participant_count"] = state_data["participant_count"]
+        state_data = data.get("data") or {}
+
+        # Update internal state with the known fields the message carries
+        changes = {key: state_data[key] for key in _STATE_KEYS & state_data.keys()}
+        if all(self.current_state[key] == value for key, value in changes.items()):
+            # Nothing changed (typical for heartbeats); skip the callbacks
+            return
+
+        self.current_state.update(changes)
 
         # Notify callbacks
         self._notify_state_update()
         log.debug(f"State updated: {self.current_state}")
 
+    async def _handle_heartbeat(self, websocket: WebSocketServerProtocol, data: Dict):
+        """Handle heartbeat from extension (carries the current state)"""
+        # Respond to heartbeat first, so state callbacks stay off the ack's
+        # round trip (no signature needed for ack)
+        await websocket.send(_FRAME_HEARTBEAT_ACK)
+
+        await self._handle_state_update(websocket, data)
+
+    async def _handle_command_response(self, websocket: WebSocketServerProtocol, data: Dict):
+        """Handle extension acknowledging a command"""
+        log.debug(f"Command response: {data}")
+
     async def _handle_message(self, websocket: WebSocketServerProtocol, message: str):
         """Handle incoming WebSocket message"""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             msg_type = data.get("type")
 
             # Handshake doesn't require authentication
@@ -309,44 +424,35 @@ class GoogleMeetsController:
                 await self._handle_handshake(websocket, data)
                 return
 
+            # Oversized tokens get their own error, so the extension does not
+            # take them for lost pairing
+            token = data.get("token")
+            if isinstance(token, str) and len(token) > _MAX_JWS_LEN:
+                await websocket.send(_FRAME_MESSAGE_TOO_LARGE)
+                log.error(f"Oversized token ({len(token)} bytes) for type: {msg_type}")
+                return
+
             # All other messages require JWS authentication
-            payload = self._verify_message(data)
+            payload = await self._verify_message(data)
             if not payload:
-                await websocket.send(json.dumps({
-                    "type": "error",
-                    "error_code": "not_authorized",
-                    "message": "Invalid signature or not authorized"
-                }))
+                await websocket.send(_FRAME_NOT_AUTHORIZED)
                 log.error(f"Message verification failed for type: {msg_type}")
                 return
 
-            # Verify the message type matches the JWS payload
-            if payload.get("type") != msg_type:
-                await websocket.send(json.dumps({
-                    "type": "error",
-                    "error_code": "type_mismatch",
-                    "message": "Message type mismatch"
-                }))
-                log.error(f"Type mismatch: expected {msg_type}, got {payload.get('type')}")
+            # The signature must cover the message type: signed as aud, or
+            # only as type by extensions that predate the aud claim
+            if payload.get("aud", payload.get("type")) != msg_type:
+                await websocket.send(_FRAME_TYPE_MISMATCH)
+                log.error(f"Type mismatch: token was not signed for {msg_type} messages")
                 return
 
-            # Handle different message types
-            if msg_type == "state":
-                await self._handle_state_update(data)
-            elif msg_type == "heartbeat":
-                # Handle state update from heartbeat data
-                await self._handle_state_update(data)
-
-                # Respond to heartbeat (no signature needed for ack)
-                response = {
-                    "type": "heartbeat_ack"
-                }
-                await websocket.send(json.dumps(response))
-            elif msg_type == "command_response":
-                # Extension acknowledged command
-                log.debug(f"Command response: {data}")
-            else:
+            # Dispatch to the handler for this message type
+            handler = self._message_handlers.get(msg_type)
+            if handler is None:
                 log.warning(f"Unknown message type: {msg_type}")
+                return
+
+            await handler(websocket, data)
 
         except json.JSONDecodeError:
             log.error("Invalid JSON received")
@@ -369,18 +475,11 @@ class GoogleMeetsController:
                 self.active_connection = None
                 self.extension_id = None
                 self.instance_id = None
+                self._session_public_key = None
                 self.connected = False
 
                 # Reset state
-                self.current_state = {
-                    "mic_enabled": False,
-                    "camera_enabled": False,
-                    "hand_raised": False,
-                    "in_meeting": False,
-                    "meeting_id": None,
-                    "meeting_name": None,
-                    "participant_count": 0,
-                }
+                self.current_state = dict(_INITIAL_STATE)
                 self._notify_state_update()
 
     async def send_command(self, action: str, data: Optional[Dict] = None) -> bool:
@@ -394,13 +493,15 @@ class GoogleMeetsController:
 
         try:
             # Send command message (no signature needed from server)
-            command = {
-                "type": "command",
-                "action": action,
-                "data": data or {}
-            }
-
-            await self.active_connection.send(json.dumps(command))
+            frame = None if data else _COMMAND_FRAMES.get(action)
+            if frame is None:
+                frame = _json_dumps({
+                    "type": "command",
+                    "action": action,
+                    "data": data or {}
+                })
+
+            await self.active_connection.send(frame)
             log.debug(f"Command sent: {action}")
             return True
         except Exception as e:
@@ -410,33 +511,80 @@ class GoogleMeetsController:
     async def _run_server(self):
         """Run WebSocket server"""
         try:
-            async with websockets.serve(self._handle_client, self.host, self.port):
+            async with websockets.serve(
+                self._handle_client, self.host, self.port, max_size=_MAX_MESSAGE_SIZE
+            ) as server:
+                self.server = server
                 log.info(f"WebSocket server started on {self.host}:{self.port}")
-                await asyncio.Future()  # Run forever
+                # Run until stop() closes the server
+                await server.wait_closed()
         except Exception as e:
             log.error(f"Server error: {e}")
+        finally:
+            self.server = None
+
+    async def _shutdown(self):
+        """Close the server and wait until its connections are closed"""
+        server = self.server
+        if server is None:
+            # Still starting: cancel _run_server instead
+            current = asyncio.current_task()
+            for task in asyncio.all_tasks():
+                if task is not current:
+                    task.cancel()
+            return
+
+        server.close()
+        await server.wait_closed()
 
     def start(self):
         """Start WebSocket server in background thread"""
-        if self.loop and self.loop.is_running():
+        if self._thread is not None and self._thread.is_alive():
             log.warning("Server already running")
             return
 
+        # Created here so stop() can reach it as soon as start() returns;
+        # stop() clears self.loop, so the thread keeps its own reference
+        loop = _new_event_loop()
+        self.loop = loop
+
         def run_loop():
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_until_complete(self._run_server())
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self._run_server())
+            except asyncio.CancelledError:
+                # stop() before the server was up
+                pass
+            try:
+                # Let stop()'s _shutdown finish before the loop goes away
+                pending = asyncio.all_tasks(loop)
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            finally:
+                loop.close()
 
         import threading
-        thread = threading.Thread(target=run_loop, daemon=True, name="google_meet_ws_server")
-        thread.start()
+        self._thread = threading.Thread(target=run_loop, daemon=True, name="google_meet_ws_server")
+        self._thread.start()
         log.info("WebSocket server thread started")
 
     def stop(self):
         """Stop WebSocket server"""
-        if self.loop:
-            self.loop.call_soon_threadsafe(self.loop.stop)
-            self.loop = None
+        loop, thread = self.loop, self._thread
+        self.loop = None
+        self._thread = None
+        if loop is not None and not loop.is_closed():
+            # Close client connections cleanly and let _run_server return;
+            # closing and waiting in one coroutine keeps the loop alive until
+            # both are done
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=5)
+            except Exception as e:
+                log.error(f"Error waiting for server to close: {e}")
+        if thread is not None:
+            thread.join(timeout=5)
+        self._verify_pool.shutdown(wait=False)
+        self.pairing.close()
         log.info("WebSocket server stopped")
 
     def get_state(self) -> Dict[str, Any]:
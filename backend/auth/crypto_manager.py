@@ -6,41 +6,64 @@ Handles all cryptographic operations for authentication:
 - Public key validation
 """
 
+import functools
 import json
 from typing import Optional, Dict
 from loguru import logger as log
 import jwt
+from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePublicKey
 
 
 class CryptoManager:
     """Handles cryptographic operations"""
 
+    __slots__ = ()
+
     @staticmethod
-    def verify_jws(token: str, public_key_jwk: Dict) -> Optional[Dict]:
+    @functools.lru_cache(maxsize=64)
+    def _load_public_key(kty: str, crv: str, x: str, y: str):
+        """
+        Load a public key from its JWK fields.
+
+        Parsing the JWK and decoding the curve point is the expensive part of
+        verification, so loaded keys are cached by their fields and each
+        instance's key is only parsed once.
         """
-        Verify JWS token with ES256 algorithm
+        public_key_json = json.dumps({"kty": kty, "crv": crv, "x": x, "y": y})
+        return jwt.algorithms.ECAlgorithm.from_jwk(public_key_json)
+
+    @staticmethod
+    def verify_jws(token: str, public_key: EllipticCurvePublicKey, *,
+                   expected_instance_id: str) -> Optional[Dict]:
+        """
+        Verify JWS token with ES256 algorithm and check its claims
+
+        The token must carry instance_id, exp and iat claims, and instance_id
+        must match the value the message claims outside the signature. The
+        signed message type (aud, or type from older extensions) is left to
+        the caller, so a mismatch can be reported apart from a bad signature.
 
         Args:
             token: JWT token string
-            public_key_jwk: Public key in JWK format
+            public_key: Public key from validate_and_load_public_key
+            expected_instance_id: Instance ID the message was sent as
 
         Returns:
             Decoded payload if valid, None otherwise
         """
         try:
-            # Convert JWK dict to JSON string for PyJWT
-            public_key_json = json.dumps(public_key_jwk)
-
-            # Load public key from JWK
-            public_key = jwt.algorithms.ECAlgorithm.from_jwk(public_key_json)
-
             # Verify and decode JWT
             payload = jwt.decode(
                 token,
                 public_key,
-                algorithms=["ES256"]
+                algorithms=["ES256"],
+                options={"require": ["instance_id", "exp", "iat"], "verify_aud": False}
             )
 
+            if payload["instance_id"] != expected_instance_id:
+                log.error("Instance ID mismatch in JWT payload")
+                return None
+
             log.debug(f"JWT verified successfully for instance: {payload.get('instance_id', 'unknown')}")
             return payload
 
@@ -55,37 +78,36 @@ class CryptoManager:
             return None
 
     @staticmethod
-    def validate_public_key(public_key_jwk: Dict) -> bool:
+    def validate_and_load_public_key(public_key_jwk: Dict) -> Optional[EllipticCurvePublicKey]:
         """
-        Validate that public key JWK is correctly formatted
+        Validate that public key JWK is correctly formatted and load it
 
         Args:
             public_key_jwk: Public key in JWK format
 
         Returns:
-            True if valid, False otherwise
+            Loaded public key for verify_jws if valid, None otherwise
         """
         try:
             # Check required fields for EC key
             if public_key_jwk.get('kty') != 'EC':
                 log.error(f"Invalid key type: {public_key_jwk.get('kty')}")
-                return False
+                return None
 
             if public_key_jwk.get('crv') != 'P-256':
                 log.error(f"Invalid curve: {public_key_jwk.get('crv')}")
-                return False
+                return None
 
             # Check for x and y coordinates
             if not public_key_jwk.get('x') or not public_key_jwk.get('y'):
                 log.error("Missing x or y coordinates in public key")
-                return False
+                return None
 
-            # Try to load it
-            public_key_json = json.dumps(public_key_jwk)
-            jwt.algorithms.ECAlgorithm.from_jwk(public_key_json)
-
-            return True
+            # Load it (cached)
+            return CryptoManager._load_public_key(
+                public_key_jwk['kty'], public_key_jwk['crv'], public_key_jwk['x'], public_key_jwk['y']
+            )
 
         except Exception as e:
             log.error(f"Error validating public key: {e}")
-            return False
+            return None
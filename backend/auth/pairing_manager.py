@@ -7,13 +7,38 @@ Handles pairing requests and instance authorization:
 - Persists authorization data
 """
 
+import atexit
 import json
+import os
+import sys
+import threading
 import time
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 from loguru import logger as log
 
+# Use orjson for the pairing file when available; both paths write indented
+# JSON that either can read back
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _json_loads = json.loads
+
+# Shared read-only stand-in for an extension with no requests, so lookups
+# don't build a throwaway dict per call
+_EMPTY = MappingProxyType({})
+
 
 @dataclass
 class PairingRequest:
@@ -24,9 +49,28 @@ class PairingRequest:
     metadata: Dict  # Browser info, extension name, etc.
     timestamp: float
 
+    # Key in the pairing file ("extension_id:instance_id")
+    _storage_key: str = field(init=False, repr=False, compare=False)
+
+    # to_dict() result; requests are not modified after creation
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._storage_key = sys.intern(f"{self.extension_id}:{self.instance_id}")
+
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization (shared, do not modify)"""
+        if self._dict_cache is None:
+            # Shares public_key/metadata rather than deep-copying them
+            # like asdict() would; serialization only reads them
+            self._dict_cache = {
+                'extension_id': self.extension_id,
+                'instance_id': self.instance_id,
+                'public_key': self.public_key,
+                'metadata': self.metadata,
+                'timestamp': self.timestamp,
+            }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'PairingRequest':
@@ -37,23 +81,46 @@ class PairingRequest:
 class PairingManager:
     """Manages pairing requests and authorized instances"""
 
-    def __init__(self, storage_path: Optional[Path] = None):
+    # Seconds to wait after a change before writing to disk, so a burst of
+    # changes is saved with a single write
+    SAVE_DELAY = 0.2
+
+    # Authorized instances kept before the least recently seen is evicted
+    DEFAULT_MAX_INSTANCES = 64
+
+    def __init__(self, storage_path: Optional[Path] = None, max_instances: int = DEFAULT_MAX_INSTANCES):
         """
         Initialize pairing manager
 
         Args:
             storage_path: Path to storage file (default: ./pairing_data.json)
+            max_instances: Maximum number of authorized instances to keep
         """
         if storage_path is None:
             storage_path = Path(__file__).parent.parent / "pairing_data.json"
 
         self.storage_path = storage_path
-        self.pending_requests: Dict[Tuple[str, str], PairingRequest] = {}
-        self.authorized_instances: Dict[Tuple[str, str], PairingRequest] = {}
+
+        # Requests by extension ID, then instance ID
+        self.pending_requests: Dict[str, Dict[str, PairingRequest]] = {}
+        self.authorized_instances: Dict[str, Dict[str, PairingRequest]] = {}
+
+        # Authorized instance keys, least recently seen (approved or
+        # handshaken) first; also the order they are saved in
+        self.max_instances = max_instances
+        self._authorized_lru: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+
+        # Deferred saving: changes set _dirty and schedule one flush()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
 
         # Load existing data
         self._load()
 
+        # Write out any unsaved changes on shutdown
+        atexit.register(self.flush)
+
     def request_pairing(self, extension_id: str, instance_id: str,
                        public_key: Dict, metadata: Dict) -> PairingRequest:
         """
@@ -68,12 +135,13 @@ class PairingManager:
         Returns:
             Created PairingRequest object
         """
-        key = (extension_id, instance_id)
-
         # Check if already authorized
-        if key in self.authorized_instances:
+        authorized = self.authorized_instances.get(extension_id, _EMPTY).get(instance_id)
+        if authorized is not None:
             log.info(f"Instance {instance_id} already authorized for {extension_id}")
-            return self.authorized_instances[key]
+            # Saved with the next change; recency doesn't warrant a write
+            self._authorized_lru.move_to_end((extension_id, instance_id))
+            return authorized
 
         # Create new request
         request = PairingRequest(
@@ -84,8 +152,8 @@ class PairingManager:
             timestamp=time.time()
         )
 
-        self.pending_requests[key] = request
-        self._save()
+        self.pending_requests.setdefault(extension_id, {})[instance_id] = request
+        self._mark_dirty()
 
         log.info(f"New pairing request from {extension_id} (instance: {instance_id})")
         log.debug(f"Metadata: {metadata}")
@@ -103,16 +171,17 @@ class PairingManager:
         Returns:
             True if approved, False if not found
         """
-        key = (extension_id, instance_id)
-
-        if key not in self.pending_requests:
+        request = self._pop(self.pending_requests, extension_id, instance_id)
+        if request is None:
             log.warning(f"No pending request found for {extension_id}/{instance_id}")
             return False
 
         # Move from pending to authorized
-        request = self.pending_requests.pop(key)
-        self.authorized_instances[key] = request
-        self._save()
+        self.authorized_instances.setdefault(extension_id, {})[instance_id] = request
+        self._authorized_lru[(extension_id, instance_id)] = None
+        self._authorized_lru.move_to_end((extension_id, instance_id))
+        self._evict_authorized()
+        self._mark_dirty()
 
         log.info(f"Approved pairing for {extension_id} (instance: {instance_id})")
 
@@ -129,15 +198,12 @@ class PairingManager:
         Returns:
             True if denied, False if not found
         """
-        key = (extension_id, instance_id)
-
-        if key not in self.pending_requests:
+        # Remove from pending
+        if self._pop(self.pending_requests, extension_id, instance_id) is None:
             log.warning(f"No pending request found for {extension_id}/{instance_id}")
             return False
 
-        # Remove from pending
-        self.pending_requests.pop(key)
-        self._save()
+        self._mark_dirty()
 
         log.info(f"Denied pairing for {extension_id} (instance: {instance_id})")
 
@@ -154,15 +220,14 @@ class PairingManager:
         Returns:
             True if revoked, False if not found
         """
-        key = (extension_id, instance_id)
-
-        if key not in self.authorized_instances:
+        # Remove from authorized
+        if self._pop(self.authorized_instances, extension_id, instance_id) is None:
             log.warning(f"No authorized instance found for {extension_id}/{instance_id}")
             return False
 
-        # Remove from authorized
-        self.authorized_instances.pop(key)
-        self._save()
+        self._authorized_lru.pop((extension_id, instance_id), None)
+
+        self._mark_dirty()
 
         log.info(f"Revoked authorization for {extension_id} (instance: {instance_id})")
 
@@ -179,8 +244,7 @@ class PairingManager:
         Returns:
             True if authorized, False otherwise
         """
-        key = (extension_id, instance_id)
-        return key in self.authorized_instances
+        return instance_id in self.authorized_instances.get(extension_id, _EMPTY)
 
     def get_public_key(self, extension_id: str, instance_id: str) -> Optional[Dict]:
         """
@@ -193,12 +257,8 @@ class PairingManager:
         Returns:
             Public key in JWK format, or None if not authorized
         """
-        key = (extension_id, instance_id)
-
-        if key not in self.authorized_instances:
-            return None
-
-        return self.authorized_instances[key].public_key
+        request = self.authorized_instances.get(extension_id, _EMPTY).get(instance_id)
+        return request.public_key if request is not None else None
 
     def get_pending_requests(self) -> List[PairingRequest]:
         """
@@ -207,7 +267,11 @@ class PairingManager:
         Returns:
             List of PairingRequest objects
         """
-        return list(self.pending_requests.values())
+        # Snapshot each level; the save timer iterates from its own thread
+        return [
+            request for requests in list(self.pending_requests.values())
+            for request in list(requests.values())
+        ]
 
     def get_authorized_instances(self, extension_id: Optional[str] = None) -> List[PairingRequest]:
         """
@@ -220,12 +284,12 @@ class PairingManager:
             List of PairingRequest objects
         """
         if extension_id is None:
-            return list(self.authorized_instances.values())
+            return [
+                request for requests in list(self.authorized_instances.values())
+                for request in list(requests.values())
+            ]
 
-        return [
-            request for (ext_id, _), request in self.authorized_instances.items()
-            if ext_id == extension_id
-        ]
+        return list(self.authorized_instances.get(extension_id, _EMPTY).values())
 
     def clear_old_pending_requests(self, max_age_seconds: int = 300) -> int:
         """
@@ -240,40 +304,116 @@ class PairingManager:
         current_time = time.time()
         to_remove = []
 
-        for key, request in self.pending_requests.items():
+        for request in self.get_pending_requests():
             age = current_time - request.timestamp
             if age > max_age_seconds:
-                to_remove.append(key)
+                to_remove.append((request.extension_id, request.instance_id))
 
-        for key in to_remove:
-            self.pending_requests.pop(key)
-            log.info(f"Cleared old pending request: {key}")
+        for extension_id, instance_id in to_remove:
+            self._pop(self.pending_requests, extension_id, instance_id)
+            log.info(f"Cleared old pending request: {extension_id}/{instance_id}")
 
         if to_remove:
-            self._save()
+            self._mark_dirty()
 
         return len(to_remove)
 
-    def _save(self):
-        """Save pairing data to disk"""
+    def _evict_authorized(self):
+        """Drop the least recently seen authorized instances beyond max_instances"""
+        while len(self._authorized_lru) > self.max_instances:
+            extension_id, instance_id = self._authorized_lru.popitem(last=False)[0]
+            self._pop(self.authorized_instances, extension_id, instance_id)
+            log.info(f"Evicted least recently seen instance: {extension_id}/{instance_id}")
+
+    def _authorized_by_recency(self) -> Iterator[PairingRequest]:
+        """Authorized instances, least recently seen first"""
+        for extension_id, instance_id in list(self._authorized_lru):
+            request = self.authorized_instances.get(extension_id, _EMPTY).get(instance_id)
+            if request is not None:
+                yield request
+
+    @staticmethod
+    def _pop(requests: Dict[str, Dict[str, PairingRequest]],
+             extension_id: str, instance_id: str) -> Optional[PairingRequest]:
+        """Remove and return a request, dropping its extension's entry once empty"""
+        by_instance = requests.get(extension_id)
+        if not by_instance:
+            return None
+
+        request = by_instance.pop(instance_id, None)
+        if not by_instance:
+            del requests[extension_id]
+        return request
+
+    def flush(self, durable: bool = True):
+        """
+        Write unsaved changes to disk now
+
+        Args:
+            durable: fsync the file before replacing the old one
+        """
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if not self._dirty:
+                return
+
+            self._dirty = False
+            self._save(durable=durable)
+
+    def close(self):
+        """Flush unsaved changes and drop the shutdown hook for this manager"""
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def _mark_dirty(self):
+        """Record a change and schedule a save (see SAVE_DELAY)"""
+        with self._save_lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                # Deferred saves skip fsync; shutdown and explicit flushes sync
+                self._flush_timer = threading.Timer(self.SAVE_DELAY, self.flush, kwargs={"durable": False})
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _save(self, durable: bool = False):
+        """
+        Save pairing data to disk
+
+        The data is written to a temporary file that then replaces the old
+        one, so a process crash mid-write never leaves a truncated file
+        behind. Only durable saves (flush(), close() and the atexit hook)
+        fsync before the replace and also survive power loss; deferred
+        saves may lose their contents if the system goes down.
+
+        Args:
+            durable: fsync the temporary file before replacing
+        """
         try:
             data = {
                 'pending': {
-                    f"{ext_id}:{inst_id}": request.to_dict()
-                    for (ext_id, inst_id), request in self.pending_requests.items()
+                    request._storage_key: request.to_dict()
+                    for request in self.get_pending_requests()
                 },
                 'authorized': {
-                    f"{ext_id}:{inst_id}": request.to_dict()
-                    for (ext_id, inst_id), request in self.authorized_instances.items()
+                    request._storage_key: request.to_dict()
+                    for request in self._authorized_by_recency()
                 }
             }
 
             # Ensure directory exists
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write to file
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write to a temporary file and swap it in
+            tmp_path = self.storage_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(data))
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.storage_path)
 
             log.debug(f"Saved pairing data to {self.storage_path}")
 
@@ -287,23 +427,27 @@ class PairingManager:
             return
 
         try:
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
+            with open(self.storage_path, 'rb') as f:
+                data = _json_loads(f.read())
 
             # Load pending requests
             for key_str, request_data in data.get('pending', {}).items():
                 ext_id, inst_id = key_str.split(':', 1)
-                key = (ext_id, inst_id)
-                self.pending_requests[key] = PairingRequest.from_dict(request_data)
+                self.pending_requests.setdefault(ext_id, {})[inst_id] = PairingRequest.from_dict(request_data)
 
             # Load authorized instances
             for key_str, request_data in data.get('authorized', {}).items():
                 ext_id, inst_id = key_str.split(':', 1)
-                key = (ext_id, inst_id)
-                self.authorized_instances[key] = PairingRequest.from_dict(request_data)
+                self.authorized_instances.setdefault(ext_id, {})[inst_id] = PairingRequest.from_dict(request_data)
+                self._authorized_lru[(ext_id, inst_id)] = None
+
+            # Apply a lowered limit to previously saved data
+            if len(self._authorized_lru) > self.max_instances:
+                self._evict_authorized()
+                self._mark_dirty()
 
-            log.info(f"Loaded {len(self.pending_requests)} pending and "
-                    f"{len(self.authorized_instances)} authorized instances")
+            log.info(f"Loaded {len(self.get_pending_requests())} pending and "
+                    f"{len(self.get_authorized_instances())} authorized instances")
 
         except Exception as e:
             log.error(f"Error loading pairing data: {e}")
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Any
 
 LOG = logging.getLogger(__name__)
@@ -16,6 +17,10 @@ class Backend(BackendBase):
     Google Meet extension via WebSocket controller.
     """
 
+    # Snapshot while no extension is connected; the controller resets the
+    # meeting state to its defaults on disconnect
+    DISCONNECTED_SNAPSHOT = (False, False, False, False, False, 0)
+
     def __init__(self):
         super().__init__()
 
@@ -24,8 +29,15 @@ class Backend(BackendBase):
         host = settings.get("websocket_host", "127.0.0.1")
         port = settings.get("websocket_port", 8765)
 
+        # Single worker that runs the controller's state callback and forwards
+        # changes to the frontend, so the WebSocket event loop never blocks
+        # on an RPC
+        self._push_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state_push")
+        self._pushed_snapshot = None
+
         # Initialize controller
         self.controller = GoogleMeetsController(host=host, port=port)
+        self.controller.add_state_update_callback(self._on_state_update, self._push_executor)
 
         # Start WebSocket server
         self.controller.start()
@@ -33,6 +45,33 @@ class Backend(BackendBase):
 
         LOG.info("Google Meet Backend initialized")
 
+    def _on_state_update(self, state: Dict[str, Any]):
+        """Push connection/meeting state changes to the frontend (runs on _push_executor)"""
+        snapshot = self._make_snapshot(self.controller.is_connected(), state)
+        if snapshot == self._pushed_snapshot:
+            return
+
+        self._pushed_snapshot = snapshot
+        try:
+            self.frontend.on_backend_state_changed(snapshot)
+        except Exception as e:
+            LOG.error(f"Error pushing state to frontend: {e}")
+
+    @staticmethod
+    def _make_snapshot(connected: bool, state: Optional[Dict[str, Any]]) -> tuple:
+        """Flatten connection status and meeting state (see get_state_snapshot)"""
+        if not state:
+            return (connected, False, None, None, None, None)
+
+        return (
+            connected,
+            bool(state.get("in_meeting", False)),
+            state.get("mic_enabled", False),
+            state.get("camera_enabled", False),
+            state.get("hand_raised", False),
+            state.get("participant_count", 0),
+        )
+
     def get_connected(self) -> bool:
         """Check if extension is connected"""
         return self.controller.is_connected()
@@ -45,6 +84,21 @@ class Backend(BackendBase):
             LOG.error(f"Error getting state: {e}")
             return None
 
+    def get_state_snapshot(self) -> tuple:
+        """
+        Get connection status and all meeting state in one call.
+
+        Returned as a flat tuple of primitives so it reaches the frontend by
+        value in a single round-trip, in the order:
+        (connected, in_meeting, mic_enabled, camera_enabled, hand_raised, participant_count)
+        Meeting fields are None when the state is unavailable. The same
+        snapshot is pushed to the frontend whenever it changes.
+        """
+        if not self.controller.is_connected():
+            return self.DISCONNECTED_SNAPSHOT
+
+        return self._make_snapshot(True, self.get_state())
+
     def get_mic_enabled(self) -> Optional[bool]:
         """Get microphone state"""
         state = self.get_state()
@@ -165,6 +219,36 @@ class Backend(BackendBase):
         """Get list of pending pairing requests"""
         return self.controller.get_pending_pairing_requests()
 
+    def get_pairing_state(self) -> tuple:
+        """
+        Get pending pairing requests and authorized instances in one call.
+
+        Returned as nested tuples of primitives so the whole result reaches
+        the frontend by value in a single round-trip.
+
+        Returns:
+            Tuple of (pending_rows, authorized_rows), each row being
+            (extension_id, instance_id, extension_name, browser_name,
+            browser_version, os); metadata fields are None when missing
+        """
+        return (
+            tuple(map(self._pairing_row, self.controller.get_pending_pairing_requests())),
+            tuple(map(self._pairing_row, self.controller.get_authorized_instances())),
+        )
+
+    @staticmethod
+    def _pairing_row(request) -> tuple:
+        """Flatten a PairingRequest into a get_pairing_state() row"""
+        metadata = request.metadata or {}
+        return (
+            request.extension_id,
+            request.instance_id,
+            metadata.get("extension_name"),
+            metadata.get("browser_name"),
+            metadata.get("browser_version"),
+            metadata.get("os"),
+        )
+
     def update_websocket_settings(self, host: str, port: int):
         """Update WebSocket server settings (requires restart)"""
         # Stop current server
@@ -172,6 +256,7 @@ class Backend(BackendBase):
 
         # Create new controller with new settings
         self.controller = GoogleMeetsController(host=host, port=port)
+        self.controller.add_state_update_callback(self._on_state_update, self._push_executor)
 
         # Start new server
         self.controller.start()
@@ -9,6 +9,10 @@ import { waitForElement } from './core/dom-utils.js';
 // Meeting detection selector - only matches when actually in a call
 const LEAVE_BUTTON_SELECTOR = '[aria-label*="Leave call" i], [aria-label*="End call" i]';
 
+// Meeting names come from page text of any length; cap them so signed state
+// messages stay well inside the backend's size limits
+const MAX_MEETING_NAME_LENGTH = 256;
+
 /**
  * Wait for meeting to start/load
  * @param {number} timeout - Timeout in milliseconds (default: 5000)
@@ -95,7 +99,7 @@ export function getMeetingName() {
     // Extract meeting name from title (usually "Meeting Name - Google Meet")
     const match = title.match(/^(.+?)\s*[-|]\s*(?:Google\s+)?Meet/i);
     if (match && match[1]) {
-      return match[1].trim();
+      return match[1].trim().slice(0, MAX_MEETING_NAME_LENGTH);
     }
   }
 
@@ -112,7 +116,7 @@ export function getMeetingName() {
     if (element) {
       const text = element.textContent?.trim();
       if (text && text.length > 0 && text !== 'Meet') {
-        return text;
+        return text.slice(0, MAX_MEETING_NAME_LENGTH);
       }
     }
   }
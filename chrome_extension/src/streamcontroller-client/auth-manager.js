@@ -239,6 +239,7 @@ export class AuthManager {
       ...payload,
       iat: Math.floor(Date.now() / 1000),  // Issued at
       exp: Math.floor(Date.now() / 1000) + 300,  // Expires in 5 minutes
+      aud: payload.type,  // Message type, checked by the backend on decode
       instance_id: this.instanceId
     };
 
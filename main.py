@@ -13,6 +13,8 @@ from gi.repository import Gtk, Adw
 
 import sys
 import os
+import time
+import weakref
 from loguru import logger as log
 
 # Add plugin to sys.paths
@@ -30,13 +32,55 @@ from actions.ImageManager import ImageManager
 
 print("Launching Google Meet! - 1")
 class GoogleMeetPlugin(PluginBase):
+    # How long (seconds) a backend state snapshot stays fresh. The TTL doubles
+    # while consecutive snapshots are unchanged, up to the max, and drops back
+    # to the base value on any change or invalidation
+    BACKEND_SNAPSHOT_TTL = 0.1
+    BACKEND_SNAPSHOT_MAX_TTL = 1.0
+
+    # Field order of Backend.get_state_snapshot()
+    BACKEND_SNAPSHOT_FIELDS = (
+        "connected", "in_meeting", "mic_enabled", "camera_enabled", "hand_raised", "participant_count",
+    )
+
+    # Input support shared by actions that work on every input type
+    FULL_SUPPORT = {
+        Input.Key: ActionInputSupport.SUPPORTED,
+        Input.Dial: ActionInputSupport.SUPPORTED,
+        Input.Touchscreen: ActionInputSupport.SUPPORTED,
+    }
+
+    # Registered actions: (action_id_suffix, action class, name, input support)
+    ACTIONS = (
+        ("ToggleMic", ToggleMic, "Toggle Microphone", FULL_SUPPORT),
+        ("ToggleCamera", ToggleCamera, "Toggle Camera", FULL_SUPPORT),
+        ("RaiseHand", RaiseHand, "Raise Hand", FULL_SUPPORT),
+        ("SendReaction", SendReaction, "Send Reaction", {
+            Input.Key: ActionInputSupport.SUPPORTED,
+            Input.Dial: ActionInputSupport.UNTESTED,
+            Input.Touchscreen: ActionInputSupport.SUPPORTED,
+        }),
+        ("InMeetingStatus", InMeetingStatus, "Meeting Status", FULL_SUPPORT),
+        ("ParticipantCount", ParticipantCount, "Participant Count", FULL_SUPPORT),
+        ("LeaveCall", LeaveCall, "Leave Call", FULL_SUPPORT),
+    )
+
     def __init__(self):
         super().__init__()
 
-        # Initialize ImageManager with all plugin images
-        log.info("Initializing ImageManager...")
-        ImageManager.initialize(os.path.join(self.PATH, "assets"))
-        log.info("ImageManager initialized")
+        # Last backend state snapshot shared by all actions, when it was taken
+        # and how long it stays fresh
+        self._snapshot = None
+        self._snapshot_time = 0.0
+        self._snapshot_ttl = self.BACKEND_SNAPSHOT_TTL
+
+        # Actions notified when the backend pushes a state change
+        self._state_listeners = weakref.WeakSet()
+
+        # Load all plugin images in the background, overlapping the backend
+        # launch; ImageManager.get_image() waits for them if needed
+        log.info("Loading plugin images in the background...")
+        ImageManager.initialize_in_background(os.path.join(self.PATH, "assets"))
 
         # Launch backend
         log.info("Launching Google Meet backend...")
@@ -49,96 +93,14 @@ class GoogleMeetPlugin(PluginBase):
         log.info("Google Meet backend launched")
 
         # Register actions
-        toggle_mic_holder = ActionHolder(
-            plugin_base=self,
-            action_base=ToggleMic,
-            action_id_suffix="ToggleMic",
-            action_name="Toggle Microphone",
-            action_support={
-                Input.Key: ActionInputSupport.SUPPORTED,
-                Input.Dial: ActionInputSupport.SUPPORTED,
-                Input.Touchscreen: ActionInputSupport.SUPPORTED,
-            },
-        )
-        self.add_action_holder(toggle_mic_holder)
-
-        toggle_camera_holder = ActionHolder(
-            plugin_base=self,
-            action_base=ToggleCamera,
-            action_id_suffix="ToggleCamera",
-            action_name="Toggle Camera",
-            action_support={
-                Input.Key: ActionInputSupport.SUPPORTED,
-                Input.Dial: ActionInputSupport.SUPPORTED,
-                Input.Touchscreen: ActionInputSupport.SUPPORTED,
-            },
-        )
-        self.add_action_holder(toggle_camera_holder)
-
-        raise_hand_holder = ActionHolder(
-            plugin_base=self,
-            action_base=RaiseHand,
-            action_id_suffix="RaiseHand",
-            action_name="Raise Hand",
-            action_support={
-                Input.Key: ActionInputSupport.SUPPORTED,
-                Input.Dial: ActionInputSupport.SUPPORTED,
-                Input.Touchscreen: ActionInputSupport.SUPPORTED,
-            },
-        )
-        self.add_action_holder(raise_hand_holder)
-
-        send_reaction_holder = ActionHolder(
-            plugin_base=self,
-            action_base=SendReaction,
-            action_id_suffix="SendReaction",
-            action_name="Send Reaction",
-            action_support={
-                Input.Key: ActionInputSupport.SUPPORTED,
-                Input.Dial: ActionInputSupport.UNTESTED,
-                Input.Touchscreen: ActionInputSupport.SUPPORTED,
-            },
-        )
-        self.add_action_holder(send_reaction_holder)
-
-        in_meeting_status_holder = ActionHolder(
-            plugin_base=self,
-            action_base=InMeetingStatus,
-            action_id_suffix="InMeetingStatus",
-            action_name="Meeting Status",
-            action_support={
-                Input.Key: ActionInputSupport.SUPPORTED,
-                Input.Dial: ActionInputSupport.SUPPORTED,
-                Input.Touchscreen: ActionInputSupport.SUPPORTED,
-            },
-        )
-        self.add_action_holder(in_meeting_status_holder)
-
-        participant_count_holder = ActionHolder(
-            plugin_base=self,
-            action_base=ParticipantCount,
-            action_id_suffix="ParticipantCount",
-            action_name="Participant Count",
-            action_support={
-                Input.Key: ActionInputSupport.SUPPORTED,
-                Input.Dial: ActionInputSupport.SUPPORTED,
-                Input.Touchscreen: ActionInputSupport.SUPPORTED,
-            },
-        )
-        self.add_action_holder(participant_count_holder)
-
-        leave_call_holder = ActionHolder(
-            plugin_base=self,
-            action_base=LeaveCall,
-            action_id_suffix="LeaveCall",
-            action_name="Leave Call",
-            action_support={
-                Input.Key: ActionInputSupport.SUPPORTED,
-                Input.Dial: ActionInputSupport.SUPPORTED,
-                Input.Touchscreen: ActionInputSupport.SUPPORTED,
-            },
-        )
-        self.add_action_holder(leave_call_holder)
+        for action_id_suffix, action_base, action_name, action_support in self.ACTIONS:
+            self.add_action_holder(ActionHolder(
+                plugin_base=self,
+                action_base=action_base,
+                action_id_suffix=action_id_suffix,
+                action_name=action_name,
+                action_support=action_support,
+            ))
 
         # Register plugin
         self.register(
@@ -152,8 +114,78 @@ class GoogleMeetPlugin(PluginBase):
 
     def get_connected(self):
         """Check if extension is connected"""
-        try:
-            return self.backend.get_connected()
-        except Exception as e:
-            log.error(e)
-            return False
\ No newline at end of file
+        return self.get_backend_status()[0]
+
+    def get_backend_snapshot(self) -> dict:
+        """
+        Get connection status and meeting state from the backend.
+
+        One backend call fetches everything; the result is shared by all
+        actions until it goes stale (see BACKEND_SNAPSHOT_TTL). The returned
+        dict is shared, so callers must not modify it.
+
+        Returns:
+            Dict keyed by BACKEND_SNAPSHOT_FIELDS
+        """
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._snapshot_time < self._snapshot_ttl:
+            return self._snapshot
+
+        snapshot = dict.fromkeys(self.BACKEND_SNAPSHOT_FIELDS)
+        snapshot["connected"] = False
+        snapshot["in_meeting"] = False
+
+        if self.backend is not None:
+            try:
+                snapshot.update(zip(self.BACKEND_SNAPSHOT_FIELDS, self.backend.get_state_snapshot()))
+            except Exception as e:
+                log.error(f"Error getting backend state: {e}")
+
+        # Poll less often while nothing changes
+        if snapshot == self._snapshot:
+            self._snapshot_ttl = min(self._snapshot_ttl * 2, self.BACKEND_SNAPSHOT_MAX_TTL)
+        else:
+            self._snapshot_ttl = self.BACKEND_SNAPSHOT_TTL
+
+        self._snapshot = snapshot
+        self._snapshot_time = now
+        return snapshot
+
+    def invalidate_backend_snapshot(self):
+        """Make the next snapshot read query the backend (e.g. after a key press)"""
+        self._snapshot = None
+        self._snapshot_ttl = self.BACKEND_SNAPSHOT_TTL
+
+    def get_backend_status(self) -> tuple[bool, bool]:
+        """
+        Get connection and meeting status from the shared backend snapshot.
+
+        Returns:
+            Tuple of (connected, in_meeting)
+        """
+        snapshot = self.get_backend_snapshot()
+        return bool(snapshot["connected"]), bool(snapshot["in_meeting"])
+
+    def add_state_listener(self, action):
+        """Register an action to be notified of backend state changes"""
+        self._state_listeners.add(action)
+
+    def on_backend_state_changed(self, snapshot: tuple):
+        """
+        Called by the backend when the connection or meeting state changes.
+
+        Replaces the shared snapshot and lets listening actions update
+        immediately instead of waiting for their next poll.
+
+        Args:
+            snapshot: Tuple in BACKEND_SNAPSHOT_FIELDS order
+        """
+        self._snapshot = dict(zip(self.BACKEND_SNAPSHOT_FIELDS, snapshot))
+        self._snapshot_time = time.monotonic()
+        self._snapshot_ttl = self.BACKEND_SNAPSHOT_TTL
+
+        for action in list(self._state_listeners):
+            try:
+                action.on_backend_state_changed()
+            except Exception as e:
+                log.error(f"Error notifying action of state change: {e}")
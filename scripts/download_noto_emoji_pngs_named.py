@@ -1,4 +1,7 @@
+import argparse
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import cairosvg
 
@@ -17,35 +20,51 @@ emoji_names = {
     "❌": "failure",
 }
 
-# Output directories
-svg_dir = "tmp_svg"
+parser = argparse.ArgumentParser(description="Download Noto emoji and render them as named 96×96 PNGs")
+parser.add_argument("--force", action="store_true", help="re-render PNGs that already exist")
+args = parser.parse_args()
+
+# Output directory
 png_dir = "reactions"
-os.makedirs(svg_dir, exist_ok=True)
 os.makedirs(png_dir, exist_ok=True)
 
 # Base URL for SVGs from Noto Emoji repo
 base_url = "https://raw.githubusercontent.com/googlefonts/noto-emoji/main/svg/emoji_u{}.svg"
 
-for emoji in emoji_names.keys():
+# One HTTP session (keep-alive) per worker thread
+thread_local = threading.local()
+
+
+def get_session():
+    if not hasattr(thread_local, "session"):
+        thread_local.session = requests.Session()
+    return thread_local.session
+
+
+def process_one(item):
+    emoji, name = item
     codepoints = "-".join(f"{ord(c):x}" for c in emoji)
     svg_url = base_url.format(codepoints)
-    svg_path = os.path.join(svg_dir, f"{emoji_names[emoji]}.svg")
-    png_path = os.path.join(png_dir, f"{emoji_names[emoji]}.png")
+    png_path = os.path.join(png_dir, f"{name}.png")
+
+    if os.path.exists(png_path) and not args.force:
+        print(f"⏭️  Skipping {emoji} ({png_path} exists)")
+        return
 
     # Download SVG
-    response = requests.get(svg_url)
+    response = get_session().get(svg_url)
     if response.status_code == 200:
-        with open(svg_path, "wb") as f:
-            f.write(response.content)
-        print(f"✅ Downloaded {emoji} SVG ({emoji_names[emoji]})")
+        print(f"✅ Downloaded {emoji} SVG ({name})")
 
-        # Render as 96×96 PNG
-        cairosvg.svg2png(url=svg_url, write_to=png_path, output_width=96, output_height=96)
+        # Render as 96×96 PNG straight from the downloaded bytes
+        cairosvg.svg2png(bytestring=response.content, write_to=png_path, output_width=96, output_height=96)
         print(f"🎨 Rendered {emoji} -> {png_path}")
-
-        # Delete SVG file to save space
-        os.remove(svg_path)
     else:
         print(f"❌ Could not find {emoji} ({response.status_code})")
 
+
+# Downloads are latency-bound, so fetch them concurrently
+with ThreadPoolExecutor(max_workers=8) as executor:
+    list(executor.map(process_one, emoji_names.items()))
+
 print("All done!")
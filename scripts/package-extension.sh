@@ -25,7 +25,7 @@ fi
 # Remove old zip if exists
 if [ -f "$OUTPUT_FILE" ]; then
     echo "🗑️  Removing old package..."
-    rm "$OUTPUT_FILE"
+    rm -f "$OUTPUT_FILE" "$OUTPUT_FILE.sha256"
 fi
 
 # Create zip file
@@ -33,10 +33,14 @@ echo "📦 Creating zip archive..."
 cd "$DIST_DIR"
 zip -r "$OUTPUT_FILE" . -x "*.DS_Store" "*.map"
 
+# Write SHA-256 checksum sidecar (verified by the plugin installer)
+(cd "$PROJECT_ROOT" && sha256sum "$(basename "$OUTPUT_FILE")" > "$OUTPUT_FILE.sha256")
+
 # Also create a simple name for Chrome Web Store upload
 cp "$OUTPUT_FILE" "$PROJECT_ROOT/chrome-extension.zip"
 
 echo "✅ Extension packaged successfully!"
 echo "📁 Output: $OUTPUT_FILE"
+echo "🔒 Checksum: $OUTPUT_FILE.sha256"
 echo "📁 Chrome Web Store ready: $PROJECT_ROOT/chrome-extension.zip"
 echo "📊 Size: $(du -h "$OUTPUT_FILE" | cut -f1)"
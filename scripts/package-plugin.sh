@@ -65,6 +65,7 @@ find "$PLUGIN_DIR" -name "*.map" -delete 2>/dev/null || true
 rm -rf "$PLUGIN_DIR/backend/.venv" 2>/dev/null || true
 rm -rf "$PLUGIN_DIR/backend/__pycache__" 2>/dev/null || true
 rm -rf "$PLUGIN_DIR/backend/pairing_data.json" 2>/dev/null || true
+rm -rf "$PLUGIN_DIR/backend/pairing_data.json.tmp" 2>/dev/null || true
 
 # Create zip file
 echo "📦 Creating zip archive..."